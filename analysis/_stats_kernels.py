@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Compiled numeric kernels for the EDA analysis
+Numba is optional and only loaded for large inputs; otherwise the same
+results come from NumPy reductions
+"""
+
+import functools
+
+import numpy as np
+
+# Importing numba and loading the cached kernel costs ~0.8 s per process,
+# while the NumPy reductions take ~0.13 s per million rows of four columns;
+# below this many rows the fallback finishes first
+JIT_MIN_ROWS = 5_000_000
+
+# Columns of the col_moments() result
+N, MEAN, M2, M3, M4, MIN, MAX = range(7)
+
+def _col_moments_numpy(A):
+    """NumPy fallback for col_moments"""
+    A = A.astype(np.float64)
+    out = np.empty((A.shape[1], 7))
+    n = np.count_nonzero(~np.isnan(A), axis=0)
+    mean = np.nansum(A, axis=0) / n
+    C = A - mean
+    C2 = C * C
+    out[:, N] = n
+    out[:, MEAN] = mean
+    out[:, M2] = np.nansum(C2, axis=0) / n
+    out[:, M3] = np.nansum(C2 * C, axis=0) / n
+    out[:, M4] = np.nansum(C2 * C2, axis=0) / n
+    out[:, MIN] = np.nanmin(A, axis=0)
+    out[:, MAX] = np.nanmax(A, axis=0)
+    return out
+
+@functools.lru_cache(maxsize=1)
+def _jit_kernel():
+    """The compiled col_moments kernel, or None without numba
+
+    Built on first use, so runs that never reach JIT_MIN_ROWS do not
+    import numba at all.
+    """
+    try:
+        from numba import njit, prange
+    except ImportError:
+        return None
+
+    # No 'nnan' fast-math flag: the kernel relies on x != x to skip NaNs
+    @njit(parallel=True, fastmath={'reassoc', 'contract', 'arcp', 'nsz'}, cache=True)
+    def _col_moments_jit(A):
+        rows, cols = A.shape
+        out = np.empty((cols, 7))
+        for j in prange(cols):
+            # First sweep: count, sum, min, max
+            n = 0.0
+            s1 = 0.0
+            lo = np.inf
+            hi = -np.inf
+            for i in range(rows):
+                x = np.float64(A[i, j])
+                if x != x:
+                    continue
+                n += 1.0
+                s1 += x
+                lo = min(lo, x)
+                hi = max(hi, x)
+            mean = s1 / n
+
+            # Second sweep: central moments, free of the cancellation
+            # that raw power sums suffer for large-offset data
+            c2 = c3 = c4 = 0.0
+            for i in range(rows):
+                x = np.float64(A[i, j])
+                if x != x:
+                    continue
+                c = x - mean
+                cc = c * c
+                c2 += cc
+                c3 += cc * c
+                c4 += cc * cc
+            out[j, N] = n
+            out[j, MEAN] = mean
+            out[j, M2] = c2 / n
+            out[j, M3] = c3 / n
+            out[j, M4] = c4 / n
+            out[j, MIN] = lo
+            out[j, MAX] = hi
+        return out
+
+    return _col_moments_jit
+
+def col_moments(A):
+    """Count, mean, central moments m2..m4, min and max of every column
+
+    A is an (n, k) float32 or float64 array; NaNs are skipped and all sums
+    are accumulated in float64. Returns a (k, 7) float64 array indexed by
+    the N, MEAN, M2, M3, M4, MIN, MAX constants. Moments are biased
+    (divided by n), as in scipy.stats.skew and kurtosis.
+    """
+    if A.shape[0] >= JIT_MIN_ROWS:
+        kernel = _jit_kernel()
+        if kernel is not None:
+            return kernel(A)
+    return _col_moments_numpy(A)
@@ -6,77 +6,257 @@ Comprehensive statistical analysis and insights generation
 
 import pandas as pd
 import numpy as np
-from scipy import stats
+from scipy import special, stats
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 import json
 import warnings
+from _stats_kernels import col_moments
 warnings.filterwarnings('ignore')
 
-def load_data(filepath):
-    """Load sensor data"""
-    print(f"Loading data from: {filepath}")
-    df = pd.read_csv(filepath)
-    df['timestamp'] = pd.to_datetime(df['timestamp'])
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:
+    pacsv = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def downcast_numeric(df):
+    """Store numeric columns in the narrowest dtype that holds their values
+
+    Floats become float32 unless pandas finds values that would not survive
+    the cast; integers shrink to the smallest integer type. Every later
+    scan of the frame then moves half the bytes or less.
+    """
+    for col in df.select_dtypes(include=["float"]).columns:
+        df[col] = pd.to_numeric(df[col], downcast="float")
+    for col in df.select_dtypes(include=["integer"]).columns:
+        df[col] = pd.to_numeric(df[col], downcast="integer")
     return df
 
+def load_data(filepath, schema=None, downcast=True):
+    """Load sensor data
+
+    ``schema`` optionally maps column names to Arrow type aliases such as
+    "float32"; the timestamp column is always parsed during the read.
+    Uses the multithreaded pyarrow CSV reader when available.
+    """
+    print(f"Loading data from: {filepath}")
+    column_types = {"timestamp": "timestamp[ns]", **(schema or {})}
+
+    if pacsv is not None:
+        convert_options = pacsv.ConvertOptions(
+            column_types={col: pa.type_for_alias(t) for col, t in column_types.items()})
+        df = pacsv.read_csv(filepath, convert_options=convert_options).to_pandas()
+    else:
+        dtypes = {col: t for col, t in column_types.items() if not t.startswith("timestamp")}
+        df = pd.read_csv(filepath, dtype=dtypes, parse_dates=["timestamp"])
+
+    return downcast_numeric(df) if downcast else df
+
 def basic_info(df):
     """Get basic dataset information"""
+    # Only object columns need the per-element deep scan; fixed-width
+    # columns report their buffer size directly
+    object_cols = [col for col in df.columns if pd.api.types.is_object_dtype(df[col])]
+    usage = df.memory_usage(deep=False)
+    if object_cols:
+        usage[object_cols] = df[object_cols].memory_usage(deep=True, index=False)
+
+    start = df['timestamp'].min()
+    end = df['timestamp'].max()
+
     info = {
         "shape": df.shape,
         "columns": list(df.columns),
         "dtypes": {col: str(dtype) for col, dtype in df.dtypes.items()},
-        "memory_usage_mb": df.memory_usage(deep=True).sum() / (1024**2),
+        "memory_usage_mb": usage.sum() / (1024**2),
         "date_range": {
-            "start": str(df['timestamp'].min()),
-            "end": str(df['timestamp'].max()),
-            "duration_days": (df['timestamp'].max() - df['timestamp'].min()).days
+            "start": str(start),
+            "end": str(end),
+            "duration_days": (end - start).days
         }
     }
     return info
 
 def missing_data_analysis(df):
     """Analyze missing data patterns"""
-    missing = df.isnull().sum()
-    missing_pct = (missing / len(df)) * 100
+    counts = df.isna().sum()
+    nonzero = counts[counts > 0]
+    pct = nonzero * (100.0 / len(df))
 
     result = {col: {
-        "count": int(missing[col]),
-        "percentage": float(missing_pct[col])
-    } for col in df.columns if missing[col] > 0}
+        "count": count,
+        "percentage": p
+    } for col, count, p in zip(nonzero.index, nonzero.to_numpy(), pct.to_numpy())}
 
     return result if result else {"message": "No missing data found"}
 
-def summary_statistics(df):
-    """Generate comprehensive summary statistics"""
-    numeric_cols = df.select_dtypes(include=[np.number]).columns
+def three_quartiles(a):
+    """Q1, median and Q3 of an array via a single O(n) partial sort
+
+    NaNs are dropped. Uses np.partition (introselect) on the bracketing
+    order statistics and interpolates linearly, matching np.quantile.
+    An empty or all-NaN column gives NaN for all three, as describe() does.
+    """
+    x = np.ascontiguousarray(a[~np.isnan(a)], dtype=np.float64)
+    if x.size == 0:
+        return np.full(3, np.nan)
+    pos = (len(x) - 1) * np.array([0.25, 0.5, 0.75])
+    lo = np.floor(pos).astype(np.intp)
+    hi = np.minimum(lo + 1, len(x) - 1)
+    x.partition(np.union1d(lo, hi))
+    return x[lo] + (x[hi] - x[lo]) * (pos - lo)
+
+def _float_dtype(dtype):
+    """float32 for columns of 4 bytes or less, float64 otherwise"""
+    return np.float32 if np.dtype(dtype).itemsize <= 4 else np.float64
+
+def numeric_arrays(df, numeric_cols):
+    """NaN-free contiguous float array for every numeric column
+
+    Built once and shared by the per-column analyses so each column is
+    materialised and scanned for NaNs a single time. Downcast columns stay
+    float32; reductions accumulate in float64.
+    """
+    # One Fortran-ordered copy of the numeric block: each column is then a
+    # contiguous view, and dropping NaNs is a single masked copy per column
+    dtype = _float_dtype(np.result_type(*df[numeric_cols].dtypes))
+    A = np.asfortranarray(df[numeric_cols].to_numpy(dtype=dtype))
+    arrays = {}
+    for k, col in enumerate(numeric_cols):
+        a = A[:, k]
+        arrays[col] = a[~np.isnan(a)]
+    return arrays
+
+def _as_matrix(arrays):
+    """Stack column arrays into one (n, k) matrix, NaN-padding short columns
+
+    Column-major, so the per-column kernels walk contiguous memory.
+    """
+    A = np.full((max(len(x) for x in arrays.values()), len(arrays)), np.nan,
+                dtype=np.result_type(*arrays.values()), order='F')
+    for k, x in enumerate(arrays.values()):
+        A[:len(x), k] = x
+    return A
+
+def _is_degenerate(col_stats):
+    """True for a constant column, which has no spread to test"""
+    return col_stats["max"] == col_stats["min"]
+
+def summary_statistics(arrays, A):
+    """Generate comprehensive summary statistics
+
+    A is _as_matrix(arrays), built once by the caller and shared with
+    outlier_detection.
+    """
+    # Counts, central moments, min and max for all columns in one fused kernel
+    moments = col_moments(A)
 
     stats_dict = {}
-    for col in numeric_cols:
-        data = df[col].dropna()
+    for (col, x), (n, mean, m2, m3, m4, col_min, col_max) in zip(arrays.items(), moments):
+        n = int(n)
+        std = np.sqrt(m2 * n / (n - 1))  # sample std (ddof=1), as pandas
+
+        # Quartiles from one partial sort instead of three full sorts
+        q1, median, q3 = three_quartiles(x)
+
+        # Shape statistics are undefined for a flat column (m2 == 0)
+        flat = col_max == col_min
+
         stats_dict[col] = {
-            "count": int(len(data)),
-            "mean": float(data.mean()),
-            "std": float(data.std()),
-            "min": float(data.min()),
-            "25%": float(data.quantile(0.25)),
-            "50%": float(data.median()),
-            "75%": float(data.quantile(0.75)),
-            "max": float(data.max()),
-            "range": float(data.max() - data.min()),
-            "cv": float(data.std() / data.mean()) if data.mean() != 0 else None,
-            "skewness": float(stats.skew(data)),
-            "kurtosis": float(stats.kurtosis(data))
+            "count": n,
+            "mean": mean,
+            "std": std,
+            "min": col_min,
+            "25%": q1,
+            "50%": median,
+            "75%": q3,
+            "max": col_max,
+            "range": col_max - col_min,
+            "cv": std / mean if mean != 0 else None,
+            # Biased skewness and excess kurtosis, matching scipy.stats defaults
+            "skewness": m3 / m2**1.5 if not flat else None,
+            "kurtosis": m4 / m2**2 - 3 if not flat else None
         }
 
     return stats_dict
 
-def normality_tests(df):
-    """Perform normality tests on numeric variables"""
-    numeric_cols = df.select_dtypes(include=[np.number]).columns
+# Anderson-Darling critical values for the normal case with estimated
+# mean and variance (D'Agostino & Stephens 1986, as used by scipy.stats.anderson)
+AD_NORM_CRITICAL = np.array([0.561, 0.631, 0.752, 0.873, 1.035])
+AD_NORM_SIGNIFICANCE = np.array([15.0, 10.0, 5.0, 2.5, 1.0])
+
+# AD/KS power is saturated well before this many observations, so longer
+# columns are tested on a reproducible random subsample of this size
+NORMALITY_MAX_SAMPLE = 10_000
+
+def _normal_gof(X, mean, std):
+    """Anderson-Darling and KS statistics for every column of X at once
+
+    X is (n, k); mean and std hold the fitted normal parameters per column.
+    Columns are standardised and sorted once and both statistics are
+    evaluated with whole-array expressions along the sample axis.
+    """
+    n = X.shape[0]
+    Z = np.sort((X - mean) / std, axis=0)
+    i = np.arange(1, n + 1)[:, None]
+
+    # Anderson-Darling: A² = -n - Σ (2i-1)/n [ln F(z_i) + ln(1 - F(z_{n+1-i}))]
+    logcdf = special.log_ndtr(Z)
+    logsf = special.log_ndtr(-Z)
+    ad_stat = -n - np.sum((2 * i - 1) / n * (logcdf + logsf[::-1]), axis=0)
+
+    # Kolmogorov-Smirnov against N(mean, std), two-sided exact p-value
+    cdf = special.ndtr(Z)
+    d_plus = np.max(i / n - cdf, axis=0)
+    d_minus = np.max(cdf - (i - 1) / n, axis=0)
+    ks_stat = np.maximum(d_plus, d_minus)
+    ks_p = np.clip(stats.kstwo.sf(ks_stat, n), 0, 1)
+
+    return ad_stat, ks_stat, ks_p
+
+def normality_tests(arrays, precomputed_stats):
+    """Perform normality tests on numeric variables
+
+    AD and KS statistics for columns longer than NORMALITY_MAX_SAMPLE are
+    computed on a subsample drawn without replacement (seeded, so reruns
+    agree); the fitted mean and std still come from the full column.
+    """
+    rng = np.random.default_rng(42)
+    samples = {}
+    for col, data in arrays.items():
+        if _is_degenerate(precomputed_stats[col]):
+            continue
+        if len(data) > NORMALITY_MAX_SAMPLE:
+            data = rng.choice(data, size=NORMALITY_MAX_SAMPLE, replace=False)
+        samples[col] = data
+
+    # Batch columns of equal length so AD/KS run once per group
+    groups = {}
+    for col, data in samples.items():
+        groups.setdefault(len(data), []).append(col)
+
+    gof = {}
+    for n, cols in groups.items():
+        X = np.column_stack([samples[col] for col in cols])
+        mean = np.array([precomputed_stats[col]["mean"] for col in cols])
+        std = np.array([precomputed_stats[col]["std"] for col in cols])
+        ad_stat, ks_stat, ks_p = _normal_gof(X, mean, std)
+        critical = np.around(AD_NORM_CRITICAL / (1.0 + 0.75 / n + 2.25 / n / n), 3)
+        for k, col in enumerate(cols):
+            gof[col] = (ad_stat[k], critical, ks_stat[k], ks_p[k])
 
     results = {}
-    for col in numeric_cols:
-        data = df[col].dropna()
+    for col, data in arrays.items():
+        if col not in gof:
+            results[col] = {"degenerate": True}
+            continue
+        ad_stat, critical, ks_stat, ks_p = gof[col]
 
         # Shapiro-Wilk test
         if len(data) <= 5000:  # Shapiro-Wilk works best for n < 5000
@@ -84,100 +264,121 @@ def normality_tests(df):
         else:
             shapiro_stat, shapiro_p = None, None
 
-        # Anderson-Darling test
-        anderson_result = stats.anderson(data)
-
-        # Kolmogorov-Smirnov test
-        ks_stat, ks_p = stats.kstest(data, 'norm', args=(data.mean(), data.std()))
-
         results[col] = {
             "shapiro_wilk": {
-                "statistic": float(shapiro_stat) if shapiro_stat else None,
-                "p_value": float(shapiro_p) if shapiro_p else None,
+                "statistic": shapiro_stat if shapiro_stat else None,
+                "p_value": shapiro_p if shapiro_p else None,
                 "is_normal": bool(shapiro_p > 0.05) if shapiro_p else None
             },
             "anderson_darling": {
-                "statistic": float(anderson_result.statistic),
-                "critical_values": anderson_result.critical_values.tolist(),
-                "significance_levels": anderson_result.significance_level.tolist()
+                "statistic": ad_stat,
+                "critical_values": critical.tolist(),
+                "significance_levels": AD_NORM_SIGNIFICANCE.tolist()
             },
             "kolmogorov_smirnov": {
-                "statistic": float(ks_stat),
-                "p_value": float(ks_p),
+                "statistic": ks_stat,
+                "p_value": ks_p,
                 "is_normal": bool(ks_p > 0.05)
             }
         }
 
     return results
 
-def outlier_detection(df):
-    """Detect outliers using IQR and Z-score methods"""
-    numeric_cols = df.select_dtypes(include=[np.number]).columns
+def outlier_detection(arrays, A, precomputed_stats):
+    """Detect outliers using IQR and Z-score methods
+
+    All columns are tested together on the NaN-padded matrix A, the one
+    _as_matrix(arrays) built for summary_statistics; the padding compares
+    False against every bound, so it never counts as an outlier.
+    """
+    col_stats = [precomputed_stats[col] for col in arrays]
+    n = np.array([len(x) for x in arrays.values()])
+
+    # IQR method, reusing the quartiles from summary_statistics
+    Q1 = np.array([s["25%"] for s in col_stats])
+    Q3 = np.array([s["75%"] for s in col_stats])
+    IQR = Q3 - Q1
+    lower = Q1 - 1.5 * IQR
+    upper = Q3 + 1.5 * IQR
+    iqr_counts = np.count_nonzero((A < lower) | (A > upper), axis=0)
+
+    # Z-score method; scipy's zscore uses the population std (ddof=0).
+    # |z| > 3 is tested as squared deviation > 9 * variance, squaring in place
+    mean = np.array([s["mean"] for s in col_stats])
+    pop_var = np.array([s["std"] for s in col_stats]) ** 2 * (n - 1) / n
+    dev = A - mean
+    np.square(dev, out=dev)
+    z_counts = np.count_nonzero(dev > 9 * pop_var, axis=0)
+
+    iqr_pct = iqr_counts * (100.0 / n)
+    z_pct = z_counts * (100.0 / n)
 
     results = {}
-    for col in numeric_cols:
-        data = df[col].dropna()
-
-        # IQR method
-        Q1 = data.quantile(0.25)
-        Q3 = data.quantile(0.75)
-        IQR = Q3 - Q1
-        lower_bound = Q1 - 1.5 * IQR
-        upper_bound = Q3 + 1.5 * IQR
-        outliers_iqr = data[(data < lower_bound) | (data > upper_bound)]
-
-        # Z-score method
-        z_scores = np.abs(stats.zscore(data))
-        outliers_zscore = data[z_scores > 3]
-
+    for k, col in enumerate(arrays):
+        if _is_degenerate(col_stats[k]):
+            results[col] = {"degenerate": True}
+            continue
         results[col] = {
             "iqr_method": {
-                "lower_bound": float(lower_bound),
-                "upper_bound": float(upper_bound),
-                "count": int(len(outliers_iqr)),
-                "percentage": float(len(outliers_iqr) / len(data) * 100)
+                "lower_bound": lower[k],
+                "upper_bound": upper[k],
+                "count": iqr_counts[k],
+                "percentage": iqr_pct[k]
             },
             "zscore_method": {
                 "threshold": 3.0,
-                "count": int(len(outliers_zscore)),
-                "percentage": float(len(outliers_zscore) / len(data) * 100)
+                "count": z_counts[k],
+                "percentage": z_pct[k]
             }
         }
 
     return results
 
-def correlation_analysis(df):
-    """Analyze correlations between numeric variables"""
-    numeric_cols = df.select_dtypes(include=[np.number]).columns
-    numeric_data = df[numeric_cols]
+def _corr_matrix(M):
+    """Pearson correlation of the columns of M as one GEMM"""
+    Mc = M - M.mean(axis=0)
+    Mc /= Mc.std(axis=0)
+    corr = np.dot(Mc.T, Mc) / len(Mc)
+    np.clip(corr, -1.0, 1.0, out=corr)  # rounding can overshoot, as in np.corrcoef
+    np.fill_diagonal(corr, 1.0)
+    return corr
+
+def correlation_analysis(df, numeric_cols):
+    """Analyze correlations between numeric variables
+
+    Rows with a missing value in any numeric column are dropped first
+    (listwise deletion), so all pairs share the same observations.
+    """
+    # float32 when every column was downcast; np.dot then runs as SGEMM
+    M = df[numeric_cols].to_numpy(dtype=_float_dtype(np.result_type(*df[numeric_cols].dtypes)))
+    M = M[~np.isnan(M).any(axis=1)]
 
     # Pearson correlation
-    pearson = numeric_data.corr(method='pearson')
-
-    # Spearman correlation
-    spearman = numeric_data.corr(method='spearman')
-
-    # Find strong correlations
-    strong_correlations = []
-    for i in range(len(pearson.columns)):
-        for j in range(i+1, len(pearson.columns)):
-            col1 = pearson.columns[i]
-            col2 = pearson.columns[j]
-            pearson_val = pearson.iloc[i, j]
-            spearman_val = spearman.iloc[i, j]
-
-            if abs(pearson_val) > 0.5:  # Strong correlation threshold
-                strong_correlations.append({
-                    "variable1": col1,
-                    "variable2": col2,
-                    "pearson": float(pearson_val),
-                    "spearman": float(spearman_val),
-                    "strength": "strong" if abs(pearson_val) > 0.7 else "moderate"
-                })
-
+    pearson_np = _corr_matrix(M)
+
+    # Spearman correlation (Pearson on average ranks)
+    spearman_np = _corr_matrix(stats.rankdata(M, axis=0))
+
+    # Find strong correlations in the upper triangle
+    iu = np.triu_indices(len(numeric_cols), k=1)
+    pv = pearson_np[iu]
+    sv = spearman_np[iu]
+    mask = np.abs(pv) > 0.5  # Strong correlation threshold
+    names = np.asarray(numeric_cols)
+    strong_correlations = [{
+        "variable1": col1,
+        "variable2": col2,
+        # float() widens float32 entries the same way .tolist() does below
+        "pearson": float(p),
+        "spearman": float(sp),
+        "strength": "strong" if abs(p) > 0.7 else "moderate"
+    } for col1, col2, p, sp in zip(names[iu[0][mask]], names[iu[1][mask]], pv[mask], sv[mask])]
+
+    # Matrices as nested row lists, ordered by "columns"
     return {
-        "pearson": pearson.to_dict(),
-        "spearman": spearman.to_dict(),
+        "columns": list(numeric_cols),
+        "pearson": pearson_np.tolist(),
+        "spearman": spearman_np.tolist(),
         "strong_correlations": strong_correlations
     }
 
@@ -215,7 +416,7 @@ def generate_insights(df, stats_summary, outliers, correlations, missing_data):
 
     # Outlier insights
     for col, outlier_info in outliers.items():
-        if outlier_info["iqr_method"]["percentage"] > 5:
+        if "iqr_method" in outlier_info and outlier_info["iqr_method"]["percentage"] > 5:
             insights.append({
                 "category": "outliers",
                 "message": f"High outlier rate in {col}: {outlier_info['iqr_method']['percentage']:.1f}% of observations",
@@ -224,7 +425,7 @@ def generate_insights(df, stats_summary, outliers, correlations, missing_data):
 
     # Distribution insights
     for col, col_stats in stats_summary.items():
-        if abs(col_stats["skewness"]) > 1:
+        if col_stats["skewness"] is not None and abs(col_stats["skewness"]) > 1:
             insights.append({
                 "category": "distribution",
                 "message": f"{col} is highly skewed (skewness={col_stats['skewness']:.2f}). Consider transformation.",
@@ -233,31 +434,66 @@ def generate_insights(df, stats_summary, outliers, correlations, missing_data):
 
     return insights
 
+def _json_default(obj):
+    """Convert numpy scalars and arrays for the stdlib json fallback"""
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def write_json(results, output_file):
+    """Write results as indented JSON, serializing numpy values natively"""
+    if orjson is not None:
+        options = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        Path(output_file).write_bytes(orjson.dumps(results, option=options))
+    else:
+        with open(output_file, 'w') as f:
+            json.dump(results, f, indent=2, default=_json_default)
+
 def main():
     # Load data
     data_file = Path(__file__).parent.parent / "data" / "raw_sensor_data.csv"
-    df = load_data(data_file)
+    # No float downcast: the reported statistics are read as published
+    # numbers, and float32 readings would carry rounding noise into them
+    # (4.9 becomes 4.900000095367432)
+    df = load_data(data_file, downcast=False)
+    numeric_cols = df.select_dtypes(include=[np.number]).columns.tolist()
+    arrays = numeric_arrays(df, numeric_cols)
+    matrix = _as_matrix(arrays)
 
     print("\n=== Running Comprehensive EDA Analysis ===\n")
 
-    # Run all analyses
-    print("1. Basic Information...")
-    basic = basic_info(df)
+    # Run all analyses. The stages only read df/arrays and spend their time
+    # in numpy/scipy code that releases the GIL, so threads overlap them
+    # without copying the data into worker processes
+    with ThreadPoolExecutor() as pool:
+        print("1. Basic Information...")
+        basic = pool.submit(basic_info, df)
+
+        print("2. Missing Data Analysis...")
+        missing = pool.submit(missing_data_analysis, df)
 
-    print("2. Missing Data Analysis...")
-    missing = missing_data_analysis(df)
+        print("6. Correlation Analysis...")
+        correlations = pool.submit(correlation_analysis, df, numeric_cols)
 
-    print("3. Summary Statistics...")
-    summary = summary_statistics(df)
+        # Summary statistics stay on the main thread: normality and outlier
+        # checks depend on them, and numba's default threading layer must
+        # not be launched from a worker thread
+        print("3. Summary Statistics...")
+        summary = summary_statistics(arrays, matrix)
 
-    print("4. Normality Tests...")
-    normality = normality_tests(df)
+        print("4. Normality Tests...")
+        normality = pool.submit(normality_tests, arrays, summary)
 
-    print("5. Outlier Detection...")
-    outliers = outlier_detection(df)
+        print("5. Outlier Detection...")
+        outliers = pool.submit(outlier_detection, arrays, matrix, summary)
 
-    print("6. Correlation Analysis...")
-    correlations = correlation_analysis(df)
+        basic = basic.result()
+        missing = missing.result()
+        normality = normality.result()
+        outliers = outliers.result()
+        correlations = correlations.result()
 
     print("7. Generating Insights...")
     insights = generate_insights(df, summary, outliers, correlations, missing)
@@ -275,8 +511,7 @@ def main():
 
     # Save results
     output_file = Path(__file__).parent / "eda_analysis.json"
-    with open(output_file, 'w') as f:
-        json.dump(results, f, indent=2)
+    write_json(results, output_file)
 
     print(f"\n=== Analysis Complete ===")
     print(f"Results saved to: {output_file}")
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Chart downsampling shared by the dashboards and the static plots
+Numba is optional and only loaded once a series needs thinning; without it
+the same indices come from a NumPy loop
+"""
+
+import functools
+
+import numpy as np
+
+def _lttb_numpy(x, y, n_out):
+    """NumPy fallback for lttb_indices, vectorized within each bucket"""
+    n = len(x)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    keep = np.empty(n_out, dtype=np.int64)
+    keep[0], keep[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        next_hi = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[hi:next_hi].mean()
+        avg_y = np.nanmean(y[hi:next_hi]) if np.isfinite(y[hi:next_hi]).any() else y[a]
+        area = np.abs((x[a] - avg_x) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (avg_y - y[a]))
+        a = lo + int(np.argmax(np.nan_to_num(area, nan=-1.0)))
+        keep[i + 1] = a
+    return keep
+
+@functools.lru_cache(maxsize=1)
+def _jit_kernel():
+    """The compiled lttb_indices kernel, or None without numba
+
+    Built on first use, so series short enough to plot as they are never
+    import numba.
+    """
+    try:
+        from numba import njit
+    except ImportError:
+        return None
+
+    @njit(cache=True)
+    def _lttb_jit(x, y, n_out):
+        n = len(x)
+        edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+        keep = np.empty(n_out, dtype=np.int64)
+        keep[0] = 0
+        keep[n_out - 1] = n - 1
+        a = 0
+        for i in range(n_out - 2):
+            lo = edges[i]
+            hi = edges[i + 1]
+            next_hi = edges[i + 2] if i + 2 < n_out - 1 else n
+
+            # Mean of the next bucket; NaN readings are skipped, and a bucket
+            # with no finite reading falls back to the last kept point
+            sx = 0.0
+            sy = 0.0
+            count = 0
+            finite = False
+            for k in range(hi, next_hi):
+                sx += x[k]
+                if y[k] == y[k]:
+                    sy += y[k]
+                    count += 1
+                    if np.isfinite(y[k]):
+                        finite = True
+            avg_x = sx / (next_hi - hi)
+            avg_y = sy / count if finite else y[a]
+
+            # Largest triangle with the last kept point; NaN areas never win
+            best = -np.inf
+            best_k = lo
+            for k in range(lo, hi):
+                area = abs((x[a] - avg_x) * (y[k] - y[a]) - (x[a] - x[k]) * (avg_y - y[a]))
+                if area != area:
+                    area = -1.0
+                if area > best:
+                    best = area
+                    best_k = k
+            a = best_k
+            keep[i + 1] = a
+        return keep
+
+    return _lttb_jit
+
+def lttb_indices(x, y, n_out):
+    """Row indices kept by Largest-Triangle-Three-Buckets downsampling
+
+    The first and last points are always kept; the rows in between are split
+    into n_out - 2 buckets and from each the point forming the largest
+    triangle with the previously kept point and the next bucket's mean wins.
+    x and y are float64 arrays of equal length.
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    kernel = _jit_kernel()
+    if kernel is not None:
+        return kernel(x, y, n_out)
+    return _lttb_numpy(x, y, n_out)
+
+def lttb(df, col, n_out):
+    """Timestamps and values of col thinned to n_out points by LTTB"""
+    if len(df) <= n_out:
+        return df['timestamp'], df[col]
+    x = df['timestamp'].to_numpy(dtype='datetime64[ns]').astype(np.int64).astype(float)
+    keep = lttb_indices(x, df[col].to_numpy(dtype=float), n_out)
+    return df['timestamp'].iloc[keep], df[col].iloc[keep]
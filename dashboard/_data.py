@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Sensor data, analysis results and the build cache shared by the Plotly
+dashboard generators
+pandas and pyarrow are only imported once data is actually loaded, so an
+up-to-date check never pays for them; pyarrow is optional, and without it
+the CSV is read by pandas
+"""
+
+import functools
+import hashlib
+import json
+import os
+from pathlib import Path
+
+DATA_FILE = Path(__file__).parent.parent / 'data' / 'raw_sensor_data.csv'
+ANALYSIS_FILE = Path(__file__).parent.parent / 'analysis' / 'eda_analysis.json'
+
+# float32 readings halve the base64 arrays Plotly embeds for each trace;
+# pressure is whole millibars and already goes out as int16
+FLOAT_COLS = ('temperature_c', 'oxygen_pct', 'co2_pct')
+
+def per_file_version(*paths):
+    """Cache a zero-argument loader until any of paths changes
+
+    The result is kept per combination of the files' mtimes, so repeated
+    calls in one process (tests, notebook reloads) skip the read until a
+    file is edited; callers must treat it as read-only.
+    """
+    def decorate(loader):
+        cached = functools.lru_cache(maxsize=4)(lambda *mtimes: loader())
+
+        @functools.wraps(loader)
+        def load():
+            return cached(*(os.stat(path).st_mtime_ns for path in paths))
+        return load
+    return decorate
+
+@per_file_version(DATA_FILE, ANALYSIS_FILE)
+def load_data():
+    """Load sensor data and analysis results
+
+    Uses the multithreaded pyarrow CSV reader when available; either way
+    the timestamps are parsed during the read.
+    """
+    import pandas as pd
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pacsv
+    except ImportError:
+        pacsv = None
+
+    if pacsv is not None:
+        column_types = {'timestamp': pa.timestamp('us'), **{col: pa.float32() for col in FLOAT_COLS}}
+        convert_options = pacsv.ConvertOptions(column_types=column_types)
+        df = pacsv.read_csv(DATA_FILE, convert_options=convert_options).to_pandas()
+    else:
+        df = pd.read_csv(DATA_FILE, parse_dates=['timestamp'], dtype={col: 'float32' for col in FLOAT_COLS})
+
+    with open(ANALYSIS_FILE, 'r') as f:
+        analysis = json.load(f)
+
+    return df, analysis
+
+def _file_stamp(path):
+    """(mtime_ns, size) of a file, cheap enough to check on every run"""
+    st = os.stat(path)
+    return st.st_mtime_ns, st.st_size
+
+def build_key(inputs, options):
+    """Fingerprint of a page's input files and build options
+
+    Inputs that do not exist (optional images) are left out.
+    """
+    stamps = [(str(path), _file_stamp(path)) for path in inputs if path.exists()]
+    return hashlib.blake2b(repr((stamps, options)).encode()).hexdigest()
+
+def _meta_file(out_path):
+    """Sidecar recording what out_path was last built from"""
+    return out_path.with_suffix('.cache.meta')
+
+def is_current(out_path, key, outputs=()):
+    """True if out_path was built from key and is unchanged since
+
+    The sidecar stores the page's own (mtime, size) next to the key, so a
+    page overwritten by another generator, edited or truncated is rebuilt
+    even when the inputs are unchanged. outputs lists further files the
+    build writes, which must all still exist.
+    """
+    meta_file = _meta_file(out_path)
+    if not (meta_file.exists() and out_path.exists() and all(path.exists() for path in outputs)):
+        return False
+    return meta_file.read_text() == f'{key} {_file_stamp(out_path)}'
+
+def record_build(out_path, key):
+    """Mark out_path as built from key, once the page is complete
+
+    Written to a temporary file and renamed into place, so an interrupted
+    run never leaves a partial record behind.
+    """
+    meta_file = _meta_file(out_path)
+    tmp_file = meta_file.with_suffix('.tmp')
+    tmp_file.write_text(f'{key} {_file_stamp(out_path)}')
+    os.replace(tmp_file, meta_file)
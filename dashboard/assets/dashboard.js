@@ -0,0 +1,325 @@
+// BGS Site 1 GasClam dashboard script, inlined into the page by
+// create_comprehensive_dashboard.py; $$name placeholders are filled from
+// template_context() (string.Template syntax)
+
+// Chart data: embedded in the data block, or fetched from its
+// data-src when the page was built with --external-data
+const dataBlock = document.getElementById('sensor-data');
+const sensorDataReady = dataBlock.dataset.src
+    ? fetch(dataBlock.dataset.src).then(response => response.json())
+    : Promise.resolve(JSON.parse(dataBlock.textContent));
+
+// BGS Colors
+const BGS_PRIMARY = '$primary';
+const BGS_SECONDARY = '$secondary';
+const TEMP_COLOR = '#dc3545';
+const PRESSURE_COLOR = '#4A90E2';
+const OXYGEN_COLOR = '#28a745';
+const CO2_COLOR = '#9c27b0';
+
+// Common layout settings
+const commonLayout = {
+    font: { family: 'Inter, sans-serif' },
+    plot_bgcolor: 'white',
+    paper_bgcolor: 'transparent',
+    hovermode: 'closest',
+    showlegend: true,
+    legend: {
+        orientation: 'h',
+        y: -0.15
+    }
+};
+
+// Charts are drawn when their container first comes within 200px of
+// the viewport, so first paint only lays out the charts on screen
+const pendingPlots = new Map();
+const plotObserver = 'IntersectionObserver' in window
+    ? new IntersectionObserver(entries => entries.forEach(entry => {
+        if (!entry.isIntersecting) return;
+        plotObserver.unobserve(entry.target);
+        pendingPlots.get(entry.target.id)();
+        pendingPlots.delete(entry.target.id);
+    }), { rootMargin: '200px' })
+    : null;
+
+function plot(id, traces, layout) {
+    const draw = () => Plotly.newPlot(id, traces, layout, {responsive: true});
+    if (!plotObserver) {
+        draw();
+        return;
+    }
+    pendingPlots.set(id, draw);
+    plotObserver.observe(document.getElementById(id));
+}
+
+// Everything below needs the chart data
+function initCharts(sensorData) {
+    // Time series data: the payload is already one array per column, so
+    // these alias it and Plotly reads the parsed arrays without copies.
+    // Timestamps arrive as seconds since t0; they become epoch milliseconds,
+    // which the date axes below read without any string parsing. t0 is
+    // parsed as UTC so the naive sensor clock is shown as recorded.
+    const { t0, t, temp: temperature, pres: pressure, o2: oxygen, co2 } = sensorData;
+    const base = Date.parse(t0 + 'Z');
+    const timestamps = t.map(s => base + s * 1000);
+
+    // Multi-Parameter Chart with Clean Stacked Subplots
+    const multiTrace1 = {
+        x: timestamps,
+        y: temperature,
+        name: 'Temperature',
+        type: 'scatter',
+        mode: 'lines',
+        line: { color: TEMP_COLOR, width: 1.5 },
+        xaxis: 'x1',
+        yaxis: 'y1'
+    };
+
+    const multiTrace2 = {
+        x: timestamps,
+        y: pressure,
+        name: 'Pressure',
+        type: 'scatter',
+        mode: 'lines',
+        line: { color: PRESSURE_COLOR, width: 1.5 },
+        xaxis: 'x2',
+        yaxis: 'y2'
+    };
+
+    const multiTrace3 = {
+        x: timestamps,
+        y: oxygen,
+        name: 'Oxygen',
+        type: 'scatter',
+        mode: 'lines',
+        line: { color: OXYGEN_COLOR, width: 1.5 },
+        xaxis: 'x3',
+        yaxis: 'y3'
+    };
+
+    const multiTrace4 = {
+        x: timestamps,
+        y: co2,
+        name: 'CO₂',
+        type: 'scatter',
+        mode: 'lines',
+        line: { color: CO2_COLOR, width: 1.5 },
+        xaxis: 'x4',
+        yaxis: 'y4'
+    };
+
+    const multiLayout = {
+        font: { family: 'Inter, sans-serif' },
+        plot_bgcolor: 'white',
+        paper_bgcolor: 'transparent',
+        height: 700,
+        showlegend: true,
+        legend: {
+            orientation: 'h',
+            y: -0.08,
+            x: 0.5,
+            xanchor: 'center'
+        },
+        // Temperature subplot
+        xaxis1: {
+            type: 'date',
+            domain: [0, 1],
+            anchor: 'y1',
+            showticklabels: false
+        },
+        yaxis1: {
+            domain: [0.78, 1],
+            anchor: 'x1',
+            title: { text: 'Temperature (°C)', font: { color: TEMP_COLOR, size: 12 } },
+            tickfont: { color: TEMP_COLOR }
+        },
+        // Pressure subplot
+        xaxis2: {
+            type: 'date',
+            domain: [0, 1],
+            anchor: 'y2',
+            showticklabels: false
+        },
+        yaxis2: {
+            domain: [0.52, 0.74],
+            anchor: 'x2',
+            title: { text: 'Pressure (mbar)', font: { color: PRESSURE_COLOR, size: 12 } },
+            tickfont: { color: PRESSURE_COLOR }
+        },
+        // Oxygen subplot
+        xaxis3: {
+            type: 'date',
+            domain: [0, 1],
+            anchor: 'y3',
+            showticklabels: false
+        },
+        yaxis3: {
+            domain: [0.26, 0.48],
+            anchor: 'x3',
+            title: { text: 'Oxygen (%)', font: { color: OXYGEN_COLOR, size: 12 } },
+            tickfont: { color: OXYGEN_COLOR }
+        },
+        // CO2 subplot
+        xaxis4: {
+            type: 'date',
+            domain: [0, 1],
+            anchor: 'y4',
+            title: 'Date'
+        },
+        yaxis4: {
+            domain: [0, 0.22],
+            anchor: 'x4',
+            title: { text: 'CO₂ (%)', font: { color: CO2_COLOR, size: 12 } },
+            tickfont: { color: CO2_COLOR }
+        },
+        margin: { l: 70, r: 40, t: 20, b: 60 }
+    };
+
+    plot('multiparamChart', [multiTrace1, multiTrace2, multiTrace3, multiTrace4], multiLayout);
+
+    // Individual parameter charts: the series with a dashed line at its mean,
+    // shaded down to zero unless fillToZero is false (series far from zero,
+    // where the fill would be a tall polygon squashing the y range)
+    function makeChart(id, y, color, name, mean, yTitle, fillToZero = true) {
+        const trace = {
+            x: timestamps,
+            y: y,
+            type: 'scatter',
+            mode: 'lines',
+            line: { color: color, width: 2 },
+            ...(fillToZero && { fill: 'tozeroy', fillcolor: color + '20' }),
+            name: name
+        };
+
+        const meanTrace = {
+            x: [timestamps[0], timestamps[timestamps.length-1]],
+            y: [mean, mean],
+            type: 'scatter',
+            mode: 'lines',
+            line: { color: color, dash: 'dash', width: 2 },
+            name: 'Mean'
+        };
+
+        plot(id, [trace, meanTrace], {
+            ...commonLayout,
+            height: 300,
+            xaxis: { type: 'date', title: 'Date' },
+            yaxis: { title: yTitle }
+        });
+    }
+
+    makeChart('tempChart', temperature, TEMP_COLOR, 'Temperature', $t_mean_value, 'Temperature (°C)');
+    makeChart('pressureChart', pressure, PRESSURE_COLOR, 'Pressure', $p_mean_value, 'Pressure (mbar)', false);
+    makeChart('oxygenChart', oxygen, OXYGEN_COLOR, 'Oxygen', $o_mean_value, 'Oxygen (%)');
+    makeChart('co2Chart', co2, CO2_COLOR, 'CO₂', $c_mean_value, 'CO₂ (%)');
+
+    // Correlation Heatmap
+    const corrData = $corr_matrix;
+
+    const corrTrace = {
+        z: corrData,
+        x: ['Temperature', 'Pressure', 'Oxygen', 'CO₂'],
+        y: ['Temperature', 'Pressure', 'Oxygen', 'CO₂'],
+        type: 'heatmap',
+        colorscale: [
+            [0, '#d62728'], [0.5, 'white'], [1, OXYGEN_COLOR]
+        ],
+        zmin: -1,
+        zmax: 1,
+        text: corrData,
+        texttemplate: '%{text:.2f}',
+        textfont: { size: 14 },
+        colorbar: {
+            title: 'Correlation',
+            titleside: 'right'
+        }
+    };
+
+    plot('corrChart', [corrTrace], {
+        ...commonLayout,
+        height: 400,
+        xaxis: { side: 'bottom' },
+        yaxis: { autorange: 'reversed' }
+    });
+
+    // Distribution Histograms
+    function makeHistogram(id, x, color, name, xTitle) {
+        const trace = {
+            x: x,
+            type: 'histogram',
+            name: name,
+            marker: { color: color, opacity: 0.7 },
+            nbinsx: 30
+        };
+
+        plot(id, [trace], {
+            ...commonLayout,
+            height: 250,
+            xaxis: { title: xTitle },
+            yaxis: { title: 'Frequency' },
+            showlegend: false
+        });
+    }
+
+    makeHistogram('tempDist', temperature, TEMP_COLOR, 'Temperature', 'Temperature (°C)');
+    makeHistogram('pressureDist', pressure, PRESSURE_COLOR, 'Pressure', 'Pressure (mbar)');
+    makeHistogram('oxygenDist', oxygen, OXYGEN_COLOR, 'Oxygen', 'Oxygen (%)');
+    makeHistogram('co2Dist', co2, CO2_COLOR, 'CO₂', 'CO₂ (%)');
+}
+
+sensorDataReady.then(initCharts);
+
+// Collapsible sections
+const collapsibles = document.querySelectorAll('.collapsible');
+collapsibles.forEach(collapsible => {
+    collapsible.addEventListener('click', function() {
+        this.classList.toggle('active');
+        const content = this.nextElementSibling;
+        content.classList.toggle('active');
+    });
+});
+
+// Smooth scroll for navigation
+document.querySelectorAll('a[href^="#"]').forEach(anchor => {
+    anchor.addEventListener('click', function (e) {
+        e.preventDefault();
+        const target = document.querySelector(this.getAttribute('href'));
+        if (target) {
+            target.scrollIntoView({ behavior: 'smooth', block: 'start' });
+        }
+    });
+});
+
+// Back to top button
+const backToTop = document.getElementById('backToTop');
+window.addEventListener('scroll', () => {
+    if (window.pageYOffset > 300) {
+        backToTop.classList.add('visible');
+    } else {
+        backToTop.classList.remove('visible');
+    }
+});
+
+function scrollToTop() {
+    window.scrollTo({ top: 0, behavior: 'smooth' });
+}
+
+// Modal functions
+function openModal(imageSrc) {
+    const modal = document.getElementById('imageModal');
+    const modalImg = document.getElementById('modalImage');
+    modal.classList.add('active');
+    modalImg.src = imageSrc;
+}
+
+function closeModal() {
+    const modal = document.getElementById('imageModal');
+    modal.classList.remove('active');
+}
+
+// ESC key to close modal
+document.addEventListener('keydown', (e) => {
+    if (e.key === 'Escape') {
+        closeModal();
+    }
+});
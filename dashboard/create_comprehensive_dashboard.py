@@ -4,1626 +4,543 @@ BGS Sensor Analysis - Comprehensive Interactive Dashboard Generator
 Creates a single, self-contained HTML file with all analysis results
 """
 
-import pandas as pd
+import numpy as np
 import json
 from pathlib import Path
+from string import Template
 import base64
+import argparse
+import os
+import gzip
+import functools
+import re
+from contextlib import ExitStack
+from concurrent.futures import ThreadPoolExecutor
+from _chart_kernels import lttb_indices
+from _data import DATA_FILE, ANALYSIS_FILE, per_file_version, build_key, is_current, record_build
+
+try:
+    import csscompressor
+except ImportError:
+    csscompressor = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import rjsmin
+except ImportError:
+    rjsmin = None
 
 # Brand Colors
 BGS_PRIMARY = '#002E40'
 BGS_SECONDARY = '#AD9C70'
 
-# Load data
-data_file = Path(__file__).parent.parent / 'data' / 'raw_sensor_data.csv'
-df = pd.read_csv(data_file)
-df['timestamp'] = pd.to_datetime(df['timestamp'])
+# Dashboard parameters and the key prefix used for them in template_context
+PARAMETERS = [('temperature_c', 't'), ('pressure_mbar', 'p'), ('oxygen_pct', 'o'), ('co2_pct', 'c')]
 
-# Load analysis results
-analysis_file = Path(__file__).parent.parent / 'analysis' / 'eda_analysis.json'
-with open(analysis_file, 'r') as f:
-    analysis = json.load(f)
+# Statistics table labels per prefix: icon, colour variable, label with
+# units (summary table) and short name (normality and outlier tables)
+PARAMETER_LABELS = {
+    't': ('fa-thermometer-half', '--temp-color', 'Temperature (°C)', 'Temperature'),
+    'p': ('fa-tachometer-alt', '--pressure-color', 'Pressure (mbar)', 'Pressure'),
+    'o': ('fa-wind', '--oxygen-color', 'Oxygen (%)', 'Oxygen'),
+    'c': ('fa-cloud', '--co2-color', 'CO₂ (%)', 'CO₂')
+}
 
-stats = analysis['summary_statistics']
-date_range = analysis['basic_info']['date_range']
+# Inputs beyond the data files shared with create_dashboard.py
+CSS_FILE = Path(__file__).parent / 'assets' / 'styles.css'
+SCRIPT_FILE = Path(__file__).parent / 'assets' / 'dashboard.js'
+TEMPLATE_FILE = Path(__file__).parent / 'templates' / 'dashboard.html'
 
-# Function to encode images as base64
 def encode_image(image_path):
-    """Encode image as base64 for embedding in HTML"""
-    try:
-        with open(image_path, 'rb') as f:
-            return base64.b64encode(f.read()).decode()
-    except:
-        return None
+    """Base64 payload of an image file, without the data URI prefix"""
+    with open(image_path, 'rb') as f:
+        return base64.b64encode(f.read())
 
-# Get all visualization files
+# Gallery images in display order: file name, alt text, caption
 viz_dir = Path(__file__).parent.parent / 'visualizations'
-viz_files = {
-    'multiparameter': viz_dir / 'multiparameter_overlay.png',
-    'distributions': viz_dir / 'distributions.png',
-    'correlation': viz_dir / 'correlation_heatmap.png',
-    'boxplots': viz_dir / 'boxplots.png',
-    'scatter_matrix': viz_dir / 'scatter_matrix.png',
-    'oxygen_co2': viz_dir / 'oxygen_co2_relationship.png',
-    'temp_ts': viz_dir / 'timeseries_temperature_c.png',
-    'pressure_ts': viz_dir / 'timeseries_pressure_mbar.png',
-    'oxygen_ts': viz_dir / 'timeseries_oxygen_pct.png',
-    'co2_ts': viz_dir / 'timeseries_co2_pct.png'
-}
-
-# Prepare data for JavaScript embedding (sample every 2nd point to reduce size)
-data_json = df.to_json(orient='records', date_format='iso')
-
-# Create HTML
-html_content = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>BGS Site 1 GasClam - Environmental Sensor Analysis Dashboard</title>
-
-    <!-- External Dependencies -->
-    <script src="https://cdn.plot.ly/plotly-2.27.0.min.js"></script>
-    <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.2/css/all.min.css">
-    <link href="https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap" rel="stylesheet">
-
-    <style>
-        :root {{
-            --bgs-primary: {BGS_PRIMARY};
-            --bgs-secondary: {BGS_SECONDARY};
-            --bgs-light: #f8f9fa;
-            --bgs-gray: #6c757d;
-            --bgs-dark: #212529;
-            --temp-color: #dc3545;
-            --pressure-color: #4A90E2;
-            --oxygen-color: #28a745;
-            --co2-color: #9c27b0;
-        }}
-
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }}
-
-        body {{
-            font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
-            line-height: 1.6;
-            color: var(--bgs-dark);
-            background: var(--bgs-light);
-        }}
-
-        /* Header Section */
-        .hero {{
-            background: linear-gradient(135deg, var(--bgs-primary) 0%, #004d66 100%);
-            color: white;
-            padding: 3rem 2rem;
-            text-align: center;
-            box-shadow: 0 4px 6px rgba(0,0,0,0.1);
-        }}
-
-        .hero h1 {{
-            font-size: 2.5rem;
-            font-weight: 700;
-            margin-bottom: 0.5rem;
-            letter-spacing: -0.5px;
-        }}
-
-        .hero .subtitle {{
-            font-size: 1.1rem;
-            opacity: 0.9;
-            font-weight: 300;
-        }}
-
-        /* Metric Cards */
-        .metrics {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
-            gap: 1.5rem;
-            max-width: 1400px;
-            margin: -2rem auto 2rem;
-            padding: 0 2rem;
-            position: relative;
-            z-index: 10;
-        }}
-
-        .metric-card {{
-            background: white;
-            border-radius: 12px;
-            padding: 1.5rem;
-            box-shadow: 0 4px 6px rgba(0,0,0,0.1);
-            transition: transform 0.2s, box-shadow 0.2s;
-            border-top: 4px solid var(--color);
-        }}
-
-        .metric-card:hover {{
-            transform: translateY(-4px);
-            box-shadow: 0 8px 12px rgba(0,0,0,0.15);
-        }}
-
-        .metric-card .icon {{
-            font-size: 2.5rem;
-            margin-bottom: 0.5rem;
-            color: var(--color);
-        }}
-
-        .metric-card .label {{
-            font-size: 0.9rem;
-            color: var(--bgs-gray);
-            font-weight: 500;
-            text-transform: uppercase;
-            letter-spacing: 0.5px;
-        }}
-
-        .metric-card .value {{
-            font-size: 2rem;
-            font-weight: 700;
-            color: var(--bgs-dark);
-            margin: 0.25rem 0;
-        }}
-
-        .metric-card .range {{
-            font-size: 0.85rem;
-            color: var(--bgs-gray);
-        }}
-
-        /* Container */
-        .container {{
-            max-width: 1400px;
-            margin: 0 auto;
-            padding: 2rem;
-        }}
-
-        /* Section Styling */
-        .section {{
-            background: white;
-            border-radius: 12px;
-            padding: 2rem;
-            margin-bottom: 2rem;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.08);
-        }}
-
-        .section h2 {{
-            color: var(--bgs-primary);
-            font-size: 1.8rem;
-            margin-bottom: 1rem;
-            padding-bottom: 0.5rem;
-            border-bottom: 3px solid var(--bgs-secondary);
-        }}
-
-        .section h3 {{
-            color: var(--bgs-primary);
-            font-size: 1.3rem;
-            margin-top: 1.5rem;
-            margin-bottom: 0.75rem;
-        }}
-
-        /* Key Findings */
-        .findings-grid {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(350px, 1fr));
-            gap: 1rem;
-            margin-top: 1rem;
-        }}
-
-        .finding {{
-            background: var(--bgs-light);
-            padding: 1rem;
-            border-radius: 8px;
-            border-left: 4px solid var(--bgs-secondary);
-        }}
-
-        .finding i {{
-            color: var(--bgs-secondary);
-            margin-right: 0.5rem;
-        }}
-
-        .status-badges {{
-            display: flex;
-            gap: 1rem;
-            flex-wrap: wrap;
-            margin-top: 1rem;
-        }}
-
-        .badge {{
-            display: inline-flex;
-            align-items: center;
-            padding: 0.5rem 1rem;
-            border-radius: 20px;
-            font-size: 0.9rem;
-            font-weight: 500;
-        }}
-
-        .badge.excellent {{
-            background: #d4edda;
-            color: #155724;
-        }}
-
-        .badge.good {{
-            background: #d1ecf1;
-            color: #0c5460;
-        }}
-
-        .badge.minimal {{
-            background: #fff3cd;
-            color: #856404;
-        }}
-
-        .badge i {{
-            margin-right: 0.5rem;
-        }}
-
-        /* Charts Grid */
-        .charts-grid {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(500px, 1fr));
-            gap: 2rem;
-            margin-top: 1.5rem;
-        }}
-
-        .chart-container {{
-            background: var(--bgs-light);
-            padding: 1rem;
-            border-radius: 8px;
-        }}
-
-        .chart-full {{
-            grid-column: 1 / -1;
-        }}
-
-        /* Stats Table */
-        .stats-table {{
-            width: 100%;
-            border-collapse: collapse;
-            margin-top: 1rem;
-        }}
-
-        .stats-table th,
-        .stats-table td {{
-            padding: 0.75rem;
-            text-align: left;
-            border-bottom: 1px solid #dee2e6;
-        }}
-
-        .stats-table th {{
-            background: var(--bgs-primary);
-            color: white;
-            font-weight: 600;
-        }}
-
-        .stats-table tr:hover {{
-            background: var(--bgs-light);
-        }}
-
-        .stats-table td:first-child {{
-            font-weight: 600;
-            color: var(--bgs-primary);
-        }}
-
-        /* Visualization Gallery */
-        .gallery {{
-            display: grid;
-            grid-template-columns: repeat(auto-fill, minmax(300px, 1fr));
-            gap: 1.5rem;
-            margin-top: 1.5rem;
-        }}
-
-        .gallery-item {{
-            position: relative;
-            cursor: pointer;
-            border-radius: 8px;
-            overflow: hidden;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-            transition: transform 0.2s, box-shadow 0.2s;
-        }}
-
-        .gallery-item:hover {{
-            transform: scale(1.03);
-            box-shadow: 0 4px 8px rgba(0,0,0,0.2);
-        }}
-
-        .gallery-item img {{
-            width: 100%;
-            height: auto;
-            display: block;
-        }}
-
-        .gallery-item .caption {{
-            position: absolute;
-            bottom: 0;
-            left: 0;
-            right: 0;
-            background: rgba(0, 46, 64, 0.9);
-            color: white;
-            padding: 0.75rem;
-            font-size: 0.9rem;
-            font-weight: 500;
-        }}
-
-        /* Modal for Lightbox */
-        .modal {{
-            display: none;
-            position: fixed;
-            z-index: 1000;
-            left: 0;
-            top: 0;
-            width: 100%;
-            height: 100%;
-            background: rgba(0,0,0,0.9);
-            align-items: center;
-            justify-content: center;
-        }}
-
-        .modal.active {{
-            display: flex;
-        }}
-
-        .modal-content {{
-            max-width: 90%;
-            max-height: 90%;
-            position: relative;
-        }}
-
-        .modal-content img {{
-            max-width: 100%;
-            max-height: 90vh;
-            border-radius: 8px;
-        }}
-
-        .modal-close {{
-            position: absolute;
-            top: -40px;
-            right: 0;
-            color: white;
-            font-size: 2rem;
-            cursor: pointer;
-            background: none;
-            border: none;
-        }}
-
-        /* Collapsible Section */
-        .collapsible {{
-            cursor: pointer;
-            padding: 1rem;
-            background: var(--bgs-light);
-            border: none;
-            text-align: left;
-            width: 100%;
-            border-radius: 8px;
-            font-size: 1.1rem;
-            font-weight: 600;
-            color: var(--bgs-primary);
-            margin-top: 1rem;
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-        }}
-
-        .collapsible:hover {{
-            background: #e9ecef;
-        }}
-
-        .collapsible.active .fa-chevron-down {{
-            transform: rotate(180deg);
-        }}
-
-        .collapsible-content {{
-            max-height: 0;
-            overflow: hidden;
-            transition: max-height 0.3s ease;
-            padding: 0 1rem;
-        }}
-
-        .collapsible-content.active {{
-            max-height: 10000px;
-            padding: 1rem;
-            overflow-y: auto;
-        }}
-
-        /* Footer */
-        .footer {{
-            background: var(--bgs-primary);
-            color: white;
-            text-align: center;
-            padding: 2rem;
-            margin-top: 3rem;
-        }}
-
-        .footer p {{
-            margin: 0.5rem 0;
-            opacity: 0.9;
-        }}
-
-        /* Sticky Navigation */
-        .nav {{
-            position: sticky;
-            top: 0;
-            background: white;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-            z-index: 100;
-            padding: 1rem 2rem;
-        }}
-
-        .nav-links {{
-            display: flex;
-            gap: 2rem;
-            justify-content: center;
-            flex-wrap: wrap;
-        }}
-
-        .nav-links a {{
-            color: var(--bgs-primary);
-            text-decoration: none;
-            font-weight: 500;
-            transition: color 0.2s;
-        }}
-
-        .nav-links a:hover {{
-            color: var(--bgs-secondary);
-        }}
-
-        /* Back to Top Button */
-        .back-to-top {{
-            position: fixed;
-            bottom: 2rem;
-            right: 2rem;
-            background: var(--bgs-secondary);
-            color: white;
-            width: 50px;
-            height: 50px;
-            border-radius: 50%;
-            border: none;
-            font-size: 1.5rem;
-            cursor: pointer;
-            box-shadow: 0 4px 6px rgba(0,0,0,0.2);
-            display: none;
-            align-items: center;
-            justify-content: center;
-            transition: opacity 0.3s;
-            z-index: 99;
-        }}
-
-        .back-to-top.visible {{
-            display: flex;
-        }}
-
-        .back-to-top:hover {{
-            opacity: 0.8;
-        }}
-
-        /* Responsive Design */
-        @media (max-width: 768px) {{
-            .hero h1 {{
-                font-size: 1.8rem;
-            }}
-
-            .metrics {{
-                grid-template-columns: 1fr;
-                margin-top: -1rem;
-            }}
-
-            .charts-grid {{
-                grid-template-columns: 1fr;
-            }}
-
-            .container {{
-                padding: 1rem;
-            }}
-
-            .nav-links {{
-                flex-direction: column;
-                align-items: center;
-                gap: 0.5rem;
-            }}
-        }}
-    </style>
-</head>
-<body>
-    <!-- Hero Header -->
-    <div class="hero">
-        <h1><i class="fas fa-chart-line"></i> BGS Site 1 GasClam</h1>
-        <h2 style="font-weight: 400; margin: 0.5rem 0;">Environmental Sensor Analysis</h2>
-        <p class="subtitle">Interactive Monitoring Dashboard | {date_range['start'].split()[0]} to {date_range['end'].split()[0]}</p>
-    </div>
-
-    <!-- Metric Cards -->
-    <div class="metrics">
-        <div class="metric-card" style="--color: var(--temp-color);">
-            <div class="icon"><i class="fas fa-thermometer-half"></i></div>
-            <div class="label">Temperature</div>
-            <div class="value">{stats['temperature_c']['mean']:.1f}°C</div>
-            <div class="range">{stats['temperature_c']['min']:.1f}°C - {stats['temperature_c']['max']:.1f}°C</div>
-        </div>
-
-        <div class="metric-card" style="--color: var(--pressure-color);">
-            <div class="icon"><i class="fas fa-tachometer-alt"></i></div>
-            <div class="label">Pressure</div>
-            <div class="value">{stats['pressure_mbar']['mean']:.0f} mbar</div>
-            <div class="range">{int(stats['pressure_mbar']['min'])} - {int(stats['pressure_mbar']['max'])} mbar</div>
-        </div>
-
-        <div class="metric-card" style="--color: var(--oxygen-color);">
-            <div class="icon"><i class="fas fa-wind"></i></div>
-            <div class="label">Oxygen</div>
-            <div class="value">{stats['oxygen_pct']['mean']:.1f}%</div>
-            <div class="range">{stats['oxygen_pct']['min']:.1f}% - {stats['oxygen_pct']['max']:.1f}%</div>
-        </div>
-
-        <div class="metric-card" style="--color: var(--co2-color);">
-            <div class="icon"><i class="fas fa-cloud"></i></div>
-            <div class="label">Carbon Dioxide</div>
-            <div class="value">{stats['co2_pct']['mean']:.1f}%</div>
-            <div class="range">{stats['co2_pct']['min']:.1f}% - {stats['co2_pct']['max']:.1f}%</div>
-        </div>
-    </div>
-
-    <!-- Sticky Navigation -->
-    <nav class="nav" id="nav">
-        <div class="nav-links">
-            <a href="#summary"><i class="fas fa-clipboard-list"></i> Summary</a>
-            <a href="#charts"><i class="fas fa-chart-area"></i> Interactive Charts</a>
-            <a href="#statistics"><i class="fas fa-calculator"></i> Statistics</a>
-            <a href="#gallery"><i class="fas fa-images"></i> Gallery</a>
-            <a href="#methodology"><i class="fas fa-flask"></i> Methodology</a>
-        </div>
-    </nav>
-
-    <div class="container">
-        <!-- Executive Summary -->
-        <div class="section" id="summary">
-            <h2><i class="fas fa-clipboard-list"></i> Executive Summary</h2>
-            <p style="font-size: 1.1rem; margin-bottom: 1.5rem;">
-                This analysis presents comprehensive statistical and scientific evaluation of environmental sensor data
-                from the BGS Site 1 GasClam borehole installation over a <strong>41-day period</strong>
-                ({date_range['duration_days']} days, 500 observations).
+GALLERY_IMAGES = [
+    ('multiparameter_overlay.png', 'Multi-parameter overlay', 'Multi-Parameter Time Series'),
+    ('distributions.png', 'Distributions', 'Probability Distributions'),
+    ('correlation_heatmap.png', 'Correlation heatmap', 'Correlation Matrix Heatmap'),
+    ('boxplots.png', 'Box plots', 'Box Plots with Violin Overlays'),
+    ('scatter_matrix.png', 'Scatter matrix', 'Scatter Plot Matrix'),
+    ('oxygen_co2_relationship.png', 'O2 vs CO2', 'O₂ vs CO₂ Relationship'),
+    ('timeseries_temperature_c.png', 'Temperature time series', 'Temperature Time Series'),
+    ('timeseries_pressure_mbar.png', 'Pressure time series', 'Pressure Time Series'),
+    ('timeseries_oxygen_pct.png', 'Oxygen time series', 'Oxygen Time Series'),
+    ('timeseries_co2_pct.png', 'CO2 time series', 'CO₂ Time Series')
+]
+
+# The hero chart at the top of the gallery: embedded as a data URI with
+# inline_images, otherwise preloaded from <head>. The other images sit
+# below the fold and load lazily, so they never compete with the
+# stylesheet and scripts for first paint
+CRITICAL_IMAGES = {'multiparameter_overlay.png'}
+
+# Fragments written into the page template's slots (see SLOTS); the page
+# itself is TEMPLATE_FILE
+
+PRELOAD_TMPL = Template("""    <link rel="preload" as="image" href="$url">
+""")
+
+# Only written when the embedded series were downsampled
+DOWNSAMPLE_NOTE_TMPL = Template("""            <p style="font-size: 0.9rem; color: var(--bgs-gray);">
+                Charts show $shown of $total readings, downsampled with LTTB to preserve their shape.
+                <a href="./data/raw_sensor_data.csv" download>Download the full-resolution CSV</a>.
             </p>
-
-            <h3>Key Findings</h3>
-            <div class="findings-grid">
-                <div class="finding">
-                    <i class="fas fa-check-circle"></i>
-                    <strong>Thermally Stable:</strong> Mean temperature 6.0°C with low variability (σ = 0.42°C) indicates stable subsurface conditions
-                </div>
-                <div class="finding">
-                    <i class="fas fa-check-circle"></i>
-                    <strong>Well-Aerated:</strong> O₂ levels average 21.5%, near atmospheric concentration, indicating excellent ventilation
-                </div>
-                <div class="finding">
-                    <i class="fas fa-check-circle"></i>
-                    <strong>Active Biogeochemistry:</strong> Elevated CO₂ (1.9%, ~50× atmospheric) demonstrates active microbial processes
-                </div>
-                <div class="finding">
-                    <i class="fas fa-check-circle"></i>
-                    <strong>Inverse Gas Correlation:</strong> O₂ vs CO₂ (r = -0.35) confirms aerobic respiration dynamics
-                </div>
-                <div class="finding">
-                    <i class="fas fa-check-circle"></i>
-                    <strong>Excellent Data Quality:</strong> 100% complete dataset with all observations validated
-                </div>
-                <div class="finding">
-                    <i class="fas fa-check-circle"></i>
-                    <strong>Minimal Outliers:</strong> Less than 1.5% outliers across all parameters
-                </div>
-            </div>
-
-            <h3 style="margin-top: 2rem;">Quality Indicators</h3>
-            <div class="status-badges">
-                <span class="badge excellent">
-                    <i class="fas fa-check-circle"></i>
-                    Data Quality: Excellent (100% complete)
-                </span>
-                <span class="badge minimal">
-                    <i class="fas fa-exclamation-triangle"></i>
-                    Anomalies: Minimal (&lt;1.5%)
-                </span>
-                <span class="badge good">
-                    <i class="fas fa-chart-line"></i>
-                    Trends: Stable with seasonal variation
-                </span>
-            </div>
-        </div>
-
-        <!-- Interactive Charts Section -->
-        <div class="section" id="charts">
-            <h2><i class="fas fa-chart-area"></i> Interactive Data Visualization</h2>
-            <p>Explore the sensor data with interactive charts. Hover for details, click legend to toggle series, zoom and pan to focus on specific periods.</p>
-
-            <!-- Individual Parameter Charts -->
-            <div class="charts-grid">
-                <div class="chart-container">
-                    <h3>Temperature (°C)</h3>
-                    <div id="tempChart"></div>
-                </div>
-                <div class="chart-container">
-                    <h3>Barometric Pressure (mbar)</h3>
-                    <div id="pressureChart"></div>
-                </div>
-                <div class="chart-container">
-                    <h3>Oxygen Concentration (%)</h3>
-                    <div id="oxygenChart"></div>
-                </div>
-                <div class="chart-container">
-                    <h3>Carbon Dioxide Concentration (%)</h3>
-                    <div id="co2Chart"></div>
-                </div>
-            </div>
-
-            <!-- Multi-Parameter Time Series -->
-            <div class="chart-container chart-full">
-                <h3>Multi-Parameter Time Series Overview</h3>
-                <p style="font-size: 0.9rem; color: var(--bgs-gray); margin-bottom: 1rem;">
-                    All four parameters displayed together in stacked subplots with synchronized zoom and pan.
-                    This layout makes it easy to spot temporal correlations between different measurements.
-                </p>
-                <div id="multiparamChart"></div>
-            </div>
-
-            <!-- Correlation Matrix -->
-            <div class="chart-container chart-full">
-                <h3>Parameter Correlation Matrix</h3>
-                <div id="corrChart"></div>
-            </div>
-
-            <!-- Distribution Charts -->
-            <div class="charts-grid">
-                <div class="chart-container">
-                    <h3>Temperature Distribution</h3>
-                    <div id="tempDist"></div>
-                </div>
-                <div class="chart-container">
-                    <h3>Pressure Distribution</h3>
-                    <div id="pressureDist"></div>
-                </div>
-                <div class="chart-container">
-                    <h3>Oxygen Distribution</h3>
-                    <div id="oxygenDist"></div>
-                </div>
-                <div class="chart-container">
-                    <h3>CO₂ Distribution</h3>
-                    <div id="co2Dist"></div>
-                </div>
-            </div>
-        </div>
-
-        <!-- Statistical Analysis Section -->
-        <div class="section" id="statistics">
-            <h2><i class="fas fa-calculator"></i> Statistical Analysis</h2>
-
-            <table class="stats-table">
-                <thead>
-                    <tr>
-                        <th>Parameter</th>
-                        <th>Mean</th>
-                        <th>Median</th>
-                        <th>Std Dev</th>
-                        <th>Min</th>
-                        <th>Max</th>
-                        <th>Range</th>
-                        <th>CV (%)</th>
-                    </tr>
-                </thead>
-                <tbody>
-                    <tr>
-                        <td><i class="fas fa-thermometer-half" style="color: var(--temp-color);"></i> Temperature (°C)</td>
-                        <td>{stats['temperature_c']['mean']:.2f}</td>
-                        <td>{stats['temperature_c']['50%']:.2f}</td>
-                        <td>{stats['temperature_c']['std']:.2f}</td>
-                        <td>{stats['temperature_c']['min']:.1f}</td>
-                        <td>{stats['temperature_c']['max']:.1f}</td>
-                        <td>{stats['temperature_c']['range']:.1f}</td>
-                        <td>{stats['temperature_c']['cv']*100:.1f}</td>
-                    </tr>
-                    <tr>
-                        <td><i class="fas fa-tachometer-alt" style="color: var(--pressure-color);"></i> Pressure (mbar)</td>
-                        <td>{stats['pressure_mbar']['mean']:.1f}</td>
-                        <td>{stats['pressure_mbar']['50%']:.1f}</td>
-                        <td>{stats['pressure_mbar']['std']:.1f}</td>
-                        <td>{int(stats['pressure_mbar']['min'])}</td>
-                        <td>{int(stats['pressure_mbar']['max'])}</td>
-                        <td>{int(stats['pressure_mbar']['range'])}</td>
-                        <td>{stats['pressure_mbar']['cv']*100:.1f}</td>
-                    </tr>
-                    <tr>
-                        <td><i class="fas fa-wind" style="color: var(--oxygen-color);"></i> Oxygen (%)</td>
-                        <td>{stats['oxygen_pct']['mean']:.2f}</td>
-                        <td>{stats['oxygen_pct']['50%']:.2f}</td>
-                        <td>{stats['oxygen_pct']['std']:.2f}</td>
-                        <td>{stats['oxygen_pct']['min']:.1f}</td>
-                        <td>{stats['oxygen_pct']['max']:.1f}</td>
-                        <td>{stats['oxygen_pct']['range']:.1f}</td>
-                        <td>{stats['oxygen_pct']['cv']*100:.1f}</td>
-                    </tr>
-                    <tr>
-                        <td><i class="fas fa-cloud" style="color: var(--co2-color);"></i> CO₂ (%)</td>
-                        <td>{stats['co2_pct']['mean']:.2f}</td>
-                        <td>{stats['co2_pct']['50%']:.2f}</td>
-                        <td>{stats['co2_pct']['std']:.2f}</td>
-                        <td>{stats['co2_pct']['min']:.1f}</td>
-                        <td>{stats['co2_pct']['max']:.1f}</td>
-                        <td>{stats['co2_pct']['range']:.1f}</td>
-                        <td>{stats['co2_pct']['cv']*100:.1f}</td>
-                    </tr>
-                </tbody>
-            </table>
-
-            <!-- Correlation Analysis -->
-            <h3>Correlation Analysis</h3>
-            <div class="finding" style="margin-top: 1rem;">
-                <p><strong>Key Correlation:</strong> Oxygen and CO₂ show moderate inverse correlation (r = {analysis['correlation_analysis']['pearson']['oxygen_pct']['co2_pct']:.3f}),
-                consistent with aerobic respiration processes where O₂ consumption produces CO₂.</p>
-            </div>
-
-            <!-- Normality Tests -->
-            <button class="collapsible">
-                <span><i class="fas fa-chart-bar"></i> Normality Tests & Advanced Statistics</span>
-                <i class="fas fa-chevron-down"></i>
-            </button>
-            <div class="collapsible-content">
-                <table class="stats-table" style="margin-top: 1rem;">
-                    <thead>
-                        <tr>
-                            <th>Parameter</th>
-                            <th>Shapiro-Wilk p</th>
-                            <th>Distribution</th>
-                            <th>Skewness</th>
-                            <th>Kurtosis</th>
-                        </tr>
-                    </thead>
-                    <tbody>
-                        <tr>
-                            <td>Temperature</td>
-                            <td>{analysis['normality_tests']['temperature_c']['shapiro_wilk']['p_value']:.4f}</td>
-                            <td>{'Normal' if analysis['normality_tests']['temperature_c']['shapiro_wilk']['is_normal'] else 'Non-normal'}</td>
-                            <td>{stats['temperature_c']['skewness']:.3f}</td>
-                            <td>{stats['temperature_c']['kurtosis']:.3f}</td>
-                        </tr>
-                        <tr>
-                            <td>Pressure</td>
-                            <td>{analysis['normality_tests']['pressure_mbar']['shapiro_wilk']['p_value']:.4f}</td>
-                            <td>{'Normal' if analysis['normality_tests']['pressure_mbar']['shapiro_wilk']['is_normal'] else 'Non-normal'}</td>
-                            <td>{stats['pressure_mbar']['skewness']:.3f}</td>
-                            <td>{stats['pressure_mbar']['kurtosis']:.3f}</td>
-                        </tr>
-                        <tr>
-                            <td>Oxygen</td>
-                            <td>{analysis['normality_tests']['oxygen_pct']['shapiro_wilk']['p_value']:.4f}</td>
-                            <td>{'Normal' if analysis['normality_tests']['oxygen_pct']['shapiro_wilk']['is_normal'] else 'Non-normal'}</td>
-                            <td>{stats['oxygen_pct']['skewness']:.3f}</td>
-                            <td>{stats['oxygen_pct']['kurtosis']:.3f}</td>
-                        </tr>
-                        <tr>
-                            <td>CO₂</td>
-                            <td>{analysis['normality_tests']['co2_pct']['shapiro_wilk']['p_value']:.4f}</td>
-                            <td>{'Normal' if analysis['normality_tests']['co2_pct']['shapiro_wilk']['is_normal'] else 'Non-normal'}</td>
-                            <td>{stats['co2_pct']['skewness']:.3f}</td>
-                            <td>{stats['co2_pct']['kurtosis']:.3f}</td>
-                        </tr>
-                    </tbody>
-                </table>
-            </div>
-
-            <!-- Outlier Detection -->
-            <button class="collapsible">
-                <span><i class="fas fa-exclamation-circle"></i> Outlier Detection Results</span>
-                <i class="fas fa-chevron-down"></i>
-            </button>
-            <div class="collapsible-content">
-                <table class="stats-table" style="margin-top: 1rem;">
-                    <thead>
-                        <tr>
-                            <th>Parameter</th>
-                            <th>IQR Outliers</th>
-                            <th>Percentage</th>
-                            <th>Z-Score Outliers</th>
-                            <th>Percentage</th>
-                        </tr>
-                    </thead>
-                    <tbody>
-                        <tr>
-                            <td>Temperature</td>
-                            <td>{analysis['outlier_detection']['temperature_c']['iqr_method']['count']}</td>
-                            <td>{analysis['outlier_detection']['temperature_c']['iqr_method']['percentage']:.1f}%</td>
-                            <td>{analysis['outlier_detection']['temperature_c']['zscore_method']['count']}</td>
-                            <td>{analysis['outlier_detection']['temperature_c']['zscore_method']['percentage']:.1f}%</td>
-                        </tr>
-                        <tr>
-                            <td>Pressure</td>
-                            <td>{analysis['outlier_detection']['pressure_mbar']['iqr_method']['count']}</td>
-                            <td>{analysis['outlier_detection']['pressure_mbar']['iqr_method']['percentage']:.1f}%</td>
-                            <td>{analysis['outlier_detection']['pressure_mbar']['zscore_method']['count']}</td>
-                            <td>{analysis['outlier_detection']['pressure_mbar']['zscore_method']['percentage']:.1f}%</td>
-                        </tr>
-                        <tr>
-                            <td>Oxygen</td>
-                            <td>{analysis['outlier_detection']['oxygen_pct']['iqr_method']['count']}</td>
-                            <td>{analysis['outlier_detection']['oxygen_pct']['iqr_method']['percentage']:.1f}%</td>
-                            <td>{analysis['outlier_detection']['oxygen_pct']['zscore_method']['count']}</td>
-                            <td>{analysis['outlier_detection']['oxygen_pct']['zscore_method']['percentage']:.1f}%</td>
-                        </tr>
-                        <tr>
-                            <td>CO₂</td>
-                            <td>{analysis['outlier_detection']['co2_pct']['iqr_method']['count']}</td>
-                            <td>{analysis['outlier_detection']['co2_pct']['iqr_method']['percentage']:.1f}%</td>
-                            <td>{analysis['outlier_detection']['co2_pct']['zscore_method']['count']}</td>
-                            <td>{analysis['outlier_detection']['co2_pct']['zscore_method']['percentage']:.1f}%</td>
-                        </tr>
-                    </tbody>
-                </table>
-            </div>
-        </div>
-
-        <!-- Visualization Gallery -->
-        <div class="section" id="gallery">
-            <h2><i class="fas fa-images"></i> Visualization Gallery</h2>
-            <p>Click on any image to view full size. All visualizations are publication-quality (300 DPI).</p>
-
-            <div class="gallery">
-                <div class="gallery-item" onclick="openModal('./visualizations/multiparameter_overlay.png')">
-                    <img src="./visualizations/multiparameter_overlay.png" alt="Multi-parameter overlay">
-                    <div class="caption">Multi-Parameter Time Series</div>
+""")
+
+# Statistics table rows, one per parameter (see PARAMETER_LABELS); the
+# placeholders are the template_context fields without their prefix
+SUMMARY_ROW_TMPL = Template("""                    <tr>
+                        <td><i class="fas $icon" style="color: var($color);"></i> $label</td>
+                        <td>$mean</td>
+                        <td>$median</td>
+                        <td>$std</td>
+                        <td>$min</td>
+                        <td>$max</td>
+                        <td>$range</td>
+                        <td>$cv_pct</td>
+                    </tr>""")
+
+NORMALITY_ROW_TMPL = Template("""                        <tr>
+                            <td>$name</td>
+                            <td>$sw_p</td>
+                            <td>$sw_label</td>
+                            <td>$skew</td>
+                            <td>$kurt</td>
+                        </tr>""")
+
+OUTLIER_ROW_TMPL = Template("""                        <tr>
+                            <td>$name</td>
+                            <td>$iqr_count</td>
+                            <td>$iqr_pct</td>
+                            <td>$z_count</td>
+                            <td>$z_pct</td>
+                        </tr>""")
+
+GALLERY_ITEM_OPEN = Template("""                <div class="gallery-item" onclick="openModal('$url')">
+""")
+
+GALLERY_ITEM_CLOSE = Template("""                    <div class="caption">$caption</div>
                 </div>
-                <div class="gallery-item" onclick="openModal('./visualizations/distributions.png')">
-                    <img src="./visualizations/distributions.png" alt="Distributions">
-                    <div class="caption">Probability Distributions</div>
-                </div>
-                <div class="gallery-item" onclick="openModal('./visualizations/correlation_heatmap.png')">
-                    <img src="./visualizations/correlation_heatmap.png" alt="Correlation heatmap">
-                    <div class="caption">Correlation Matrix Heatmap</div>
-                </div>
-                <div class="gallery-item" onclick="openModal('./visualizations/boxplots.png')">
-                    <img src="./visualizations/boxplots.png" alt="Box plots">
-                    <div class="caption">Box Plots with Violin Overlays</div>
-                </div>
-                <div class="gallery-item" onclick="openModal('./visualizations/scatter_matrix.png')">
-                    <img src="./visualizations/scatter_matrix.png" alt="Scatter matrix">
-                    <div class="caption">Scatter Plot Matrix</div>
-                </div>
-                <div class="gallery-item" onclick="openModal('./visualizations/oxygen_co2_relationship.png')">
-                    <img src="./visualizations/oxygen_co2_relationship.png" alt="O2 vs CO2">
-                    <div class="caption">O₂ vs CO₂ Relationship</div>
-                </div>
-                <div class="gallery-item" onclick="openModal('./visualizations/timeseries_temperature_c.png')">
-                    <img src="./visualizations/timeseries_temperature_c.png" alt="Temperature time series">
-                    <div class="caption">Temperature Time Series</div>
-                </div>
-                <div class="gallery-item" onclick="openModal('./visualizations/timeseries_pressure_mbar.png')">
-                    <img src="./visualizations/timeseries_pressure_mbar.png" alt="Pressure time series">
-                    <div class="caption">Pressure Time Series</div>
-                </div>
-                <div class="gallery-item" onclick="openModal('./visualizations/timeseries_oxygen_pct.png')">
-                    <img src="./visualizations/timeseries_oxygen_pct.png" alt="Oxygen time series">
-                    <div class="caption">Oxygen Time Series</div>
-                </div>
-                <div class="gallery-item" onclick="openModal('./visualizations/timeseries_co2_pct.png')">
-                    <img src="./visualizations/timeseries_co2_pct.png" alt="CO2 time series">
-                    <div class="caption">CO₂ Time Series</div>
-                </div>
-            </div>
-        </div>
-
-        <!-- Methodology Section -->
-        <button class="collapsible" id="methodology">
-            <span><i class="fas fa-flask"></i> Data Quality & Methodology</span>
-            <i class="fas fa-chevron-down"></i>
-        </button>
-        <div class="collapsible-content">
-            <h3>Data Source</h3>
-            <ul style="line-height: 1.8;">
-                <li><strong>Sensor:</strong> BGS Site 1 GasClam Borehole</li>
-                <li><strong>API:</strong> BGS SensorThings API (MCP tools)</li>
-                <li><strong>Datastreams:</strong> Temperature (ID 94), Pressure (ID 102), Oxygen (ID 109), CO₂ (ID 110)</li>
-                <li><strong>Observations:</strong> 500 measurements</li>
-                <li><strong>Period:</strong> {date_range['start'].split()[0]} to {date_range['end'].split()[0]} ({date_range['duration_days']} days)</li>
-                <li><strong>Sampling Interval:</strong> ~2 hours</li>
-            </ul>
-
-            <h3>Statistical Methods</h3>
-            <ul style="line-height: 1.8;">
-                <li><strong>Descriptive Statistics:</strong> Mean, median, std dev, quartiles, range, CV, skewness, kurtosis</li>
-                <li><strong>Normality Tests:</strong> Shapiro-Wilk, Anderson-Darling, Kolmogorov-Smirnov</li>
-                <li><strong>Correlation Analysis:</strong> Pearson and Spearman correlation matrices</li>
-                <li><strong>Outlier Detection:</strong> IQR method (1.5× IQR) and Z-score method (|z| > 3)</li>
-            </ul>
-
-            <h3>Data Quality Assessment</h3>
-            <table class="stats-table">
-                <tr>
-                    <td><strong>Completeness</strong></td>
-                    <td>100% - No missing data</td>
-                    <td><span class="badge excellent"><i class="fas fa-check"></i> Excellent</span></td>
-                </tr>
-                <tr>
-                    <td><strong>Validation</strong></td>
-                    <td>100% observations marked "Good"</td>
-                    <td><span class="badge excellent"><i class="fas fa-check"></i> Excellent</span></td>
-                </tr>
-                <tr>
-                    <td><strong>Outliers</strong></td>
-                    <td>&lt;1.5% across all parameters</td>
-                    <td><span class="badge minimal"><i class="fas fa-info-circle"></i> Minimal</span></td>
-                </tr>
-                <tr>
-                    <td><strong>Temporal Coverage</strong></td>
-                    <td>41 days continuous monitoring</td>
-                    <td><span class="badge good"><i class="fas fa-calendar"></i> Good</span></td>
-                </tr>
-            </table>
-
-            <h3>Technologies Used</h3>
-            <ul style="line-height: 1.8;">
-                <li><strong>Data Source:</strong> BGS SensorThings API (MCP tools)</li>
-                <li><strong>Analysis:</strong> Python 3.13, pandas, NumPy, SciPy</li>
-                <li><strong>Visualizations:</strong> Matplotlib, Seaborn, Plotly.js</li>
-                <li><strong>Dashboard:</strong> HTML5, CSS3, JavaScript</li>
-                <li><strong>AI Analysis Tool:</strong> Claude Sonnet 4.5 in Claude Code with scientific-thinking and scientific-packages skills</li>
-            </ul>
-
-            <h3>How This Analysis Was Created</h3>
-            <p style="line-height: 1.8;">
-                This comprehensive analysis was generated using <strong>Claude Code</strong>, an AI-powered development environment,
-                with <strong>Claude Sonnet 4.5</strong> as the underlying AI model. The analysis leveraged specialized
-                <strong>scientific skills</strong> that automate best practices for data analysis, statistical testing, and
-                scientific visualization.
-            </p>
-            <p style="line-height: 1.8;">
-                The scientific skills used include:
-            </p>
-            <ul style="line-height: 1.8;">
-                <li><strong>scientific-thinking:exploratory-data-analysis</strong> - Automated EDA workflows for comprehensive statistical analysis</li>
-                <li><strong>scientific-packages</strong> - Python scientific computing libraries (pandas, NumPy, SciPy, Matplotlib, Seaborn)</li>
-                <li><strong>BGS Sensor Data MCP</strong> - Model Context Protocol tools for accessing BGS SensorThings API</li>
-            </ul>
-            <p style="line-height: 1.8;">
-                This approach combines human expertise in scientific method with AI capabilities for rapid data processing,
-                statistical analysis, and visualization generation, ensuring both rigor and efficiency.
-            </p>
-
-            <h3>Limitations</h3>
-            <ul style="line-height: 1.8;">
-                <li>Point measurements may not represent broader spatial conditions</li>
-                <li>Winter/spring data only - summer conditions may differ significantly</li>
-                <li>2-hour sampling may miss rapid transient events</li>
-                <li>41-day period insufficient for robust long-term trend analysis (recommend ≥1 year)</li>
-            </ul>
-        </div>
-
-        <!-- Original Analysis Prompt Section -->
-        <button class="collapsible">
-            <span><i class="fas fa-code"></i> Original Analysis Prompt</span>
-            <i class="fas fa-chevron-down"></i>
-        </button>
-        <div class="collapsible-content">
-            <p style="margin-top: 1rem; line-height: 1.8;">
-                This analysis was generated from the following prompt, which provides a comprehensive framework for
-                scientific data analysis and visualization:
-            </p>
-            <div style="background: #f8f9fa; padding: 1.5rem; border-radius: 8px; border-left: 4px solid var(--bgs-secondary); margin-top: 1rem; overflow-x: auto;">
-                <pre style="white-space: pre-wrap; font-family: 'Courier New', monospace; font-size: 0.9rem; line-height: 1.6; margin: 0;">Always use available 'skills' when possible. Keep the output organized.
-
-# BGS Sensor Data Analysis Project
-
-## Objective
-Analyze, explore, explain, and visualize environmental sensor data from BGS Site 1 GasClam borehole. Create a professional, interactive dashboard following UX/UI best practices.
-
-## Data Source
-- **Sensor**: BGS Site 1 GasClam
-- **Dataset**: Last 500 readings
-- **Datastreams to analyze**:
-  - ID 94: Temperature (°C)
-  - ID 102: Barometric Pressure (mbar)
-  - ID 109: Oxygen (%)
-  - ID 110: Carbon Dioxide (%)
-
-## Available MCP Tools
-You have access to these BGS sensor MCP tools:
-- about_bgs_sensor_data
-- list_sensors
-- list_locations
-- list_observed_properties
-- get_sensor_details
-- get_sensor_datastreams
-- get_datastream_observations
-
-## Requirements
-
-### 1. Data Collection & Preparation
-- Use MCP tools to fetch the last 500 observations for each datastream (IDs: 94, 102, 109, 110)
-- Clean and structure the data for analysis
-- Document any data quality issues or anomalies
-
-### 2. Exploratory Data Analysis
-- Generate comprehensive descriptive statistics for all datastreams
-- Identify temporal patterns, trends, and seasonality
-- Detect outliers and anomalies
-- Analyze correlations between different parameters (e.g., temperature vs CO2, pressure vs O2)
-- Calculate key metrics (mean, median, std dev, min/max, percentiles)
-
-### 3. Statistical Analysis
-- Perform time-series decomposition if applicable
-- Identify significant trends or changes over time
-- Test for correlations between parameters
-- Provide confidence intervals where relevant
-
-### 4. Visualizations
-Create professional, scientific-quality visualizations:
-- Time-series plots for each parameter
-- Multi-parameter overlay charts to show relationships
-- Distribution plots (histograms, box plots)
-- Correlation heatmap
-- Scatter plots for parameter relationships
-- Any other relevant visualizations
-
-### 5. Interactive Dashboard
-Create a professional HTML dashboard with:
-- **Brand Colors**: Primary: #002E40, Secondary: #AD9C70
-- **Design Requirements**:
-  - Clean, professional layout following UX/UI best practices
-  - Responsive design
-  - Clear navigation and section organization
-  - Interactive plots (use Plotly for interactivity)
-  - Data tables with key statistics
-  - Mobile-friendly if possible
-- **Content Sections**:
-  - Executive summary with key findings
-  - Individual parameter analysis
-  - Cross-parameter correlations
-  - Anomaly detection results
-  - Statistical insights
-  - Data quality notes
-
-### 6. Scientific Interpretation
-- Explain what the sensor readings indicate about subsurface conditions
-- Interpret correlations (e.g., Why might CO2 and O2 be inversely related?)
-- Identify any concerning patterns or anomalies
-- Provide context for normal vs abnormal ranges if known
-
-### 7. Documentation
-- Create a comprehensive README.md with:
-  - Project overview
-  - Data sources and methodology
-  - Key findings and insights
-  - Instructions for viewing the dashboard
-  - Technical notes
-
-## Output Structure
-Organize the work directory as follows:
-```
-bgs-sensor-analysis/
-├── data/
-│   └── raw_sensor_data.csv
-├── analysis/
-│   ├── eda_report.txt
-│   ├── statistical_analysis.txt
-│   └── findings.md
-├── visualizations/
-│   └── [individual plot files]
-├── dashboard/
-│   ├── index.html
-│   └── assets/
-├── README.md
-└── requirements.txt
-```
-
-## Best Practices
-- Use type hints and docstrings in Python code
-- Follow scientific data analysis standards
-- Ensure all visualizations have proper labels, titles, and legends
-- Include units of measurement on all plots
-- Document any assumptions or limitations
-- Make the dashboard self-explanatory for non-technical users
-
-## Deliverables
-1. Clean, well-commented analysis scripts
-2. Interactive HTML dashboard with BGS branding
-3. Individual visualization files (PNG/SVG for static, HTML for interactive)
-4. Comprehensive README.md
-5. Summary PDF report (optional but recommended)
-6. Data quality assessment document
-
-Use the scientific-packages and scientific-thinking skills to implement best practices for exploratory data analysis, statistical testing, and scientific visualization throughout this project.
-
----
-
-## Why This Prompt Works
-
-1. **Clear Structure**: Organized into logical sections that Claude Code can follow step-by-step
-2. **Specific Requirements**: Exact datastream IDs, colors, and tools mentioned
-3. **Triggers Skills**: Explicitly mentions using available skills and scientific workflows
-4. **Professional Standards**: Emphasizes UX/UI best practices and scientific rigor
-5. **Comprehensive Scope**: Covers analysis, visualization, and interpretation
-6. **Deliverables Focused**: Clear outputs expected
-
-## Tips for Best Results
-
-1. **Install these skills first** in Claude Code:
-   - scientific-packages
-   - scientific-thinking
-   - scientific-context-initialization
-
-2. **Before running the prompt**, you might want to test the MCP connection:
-   "Use the BGS sensor MCP tools to show me what sensors are available and confirm you can access the data"
-
-3. **If Claude isn't using skills**, add this at the start:
-   "IMPORTANT: Search for and use existing skills before attempting any task. Use scientific-thinking for EDA and scientific-packages for visualization."</pre>
-                </div>
-                <p style="margin-top: 1rem; line-height: 1.8; font-style: italic; color: var(--bgs-gray);">
-                    This structured prompt ensures comprehensive analysis coverage, scientific rigor, and professional
-                    presentation standards. It demonstrates how AI tools can be effectively guided to produce
-                    publication-quality scientific work.
-                </p>
-            </div>
-    </div>
-
-    <!-- Modal for Image Lightbox -->
-    <div id="imageModal" class="modal" onclick="closeModal()">
-        <div class="modal-content">
-            <button class="modal-close" onclick="closeModal()"><i class="fas fa-times"></i></button>
-            <img id="modalImage" src="" alt="Full size image">
-        </div>
-    </div>
-
-    <!-- Back to Top Button -->
-    <button class="back-to-top" id="backToTop" onclick="scrollToTop()">
-        <i class="fas fa-arrow-up"></i>
-    </button>
-
-    <!-- Footer -->
-    <div class="footer">
-        <h3 style="color: var(--bgs-secondary); margin-bottom: 1rem;">BGS Site 1 GasClam Analysis</h3>
-        <p><strong>Analysis Date:</strong> Saturday, October 25, 2025</p>
-        <p><strong>Data Source:</strong> British Geological Survey SensorThings API</p>
-        <p style="margin-top: 1rem; opacity: 0.7;">
-            <i class="fas fa-chart-line"></i> Generated with Python 3.13 |
-            <i class="fas fa-code"></i> Powered by Plotly.js
-        </p>
-    </div>
-
-    <script>
-        // Embedded data
-        const sensorData = {data_json};
-
-        // BGS Colors
-        const BGS_PRIMARY = '{BGS_PRIMARY}';
-        const BGS_SECONDARY = '{BGS_SECONDARY}';
-        const TEMP_COLOR = '#dc3545';
-        const PRESSURE_COLOR = '#4A90E2';
-        const OXYGEN_COLOR = '#28a745';
-        const CO2_COLOR = '#9c27b0';
-
-        // Common layout settings
-        const commonLayout = {{
-            font: {{ family: 'Inter, sans-serif' }},
-            plot_bgcolor: 'white',
-            paper_bgcolor: 'transparent',
-            hovermode: 'closest',
-            showlegend: true,
-            legend: {{
-                orientation: 'h',
-                y: -0.15
-            }}
-        }};
-
-        // Extract time series data
-        const timestamps = sensorData.map(d => d.timestamp);
-        const temperature = sensorData.map(d => d.temperature_c);
-        const pressure = sensorData.map(d => d.pressure_mbar);
-        const oxygen = sensorData.map(d => d.oxygen_pct);
-        const co2 = sensorData.map(d => d.co2_pct);
-
-        // Multi-Parameter Chart with Clean Stacked Subplots
-        const multiTrace1 = {{
-            x: timestamps,
-            y: temperature,
-            name: 'Temperature',
-            type: 'scatter',
-            mode: 'lines',
-            line: {{ color: TEMP_COLOR, width: 1.5 }},
-            xaxis: 'x1',
-            yaxis: 'y1'
-        }};
-
-        const multiTrace2 = {{
-            x: timestamps,
-            y: pressure,
-            name: 'Pressure',
-            type: 'scatter',
-            mode: 'lines',
-            line: {{ color: PRESSURE_COLOR, width: 1.5 }},
-            xaxis: 'x2',
-            yaxis: 'y2'
-        }};
-
-        const multiTrace3 = {{
-            x: timestamps,
-            y: oxygen,
-            name: 'Oxygen',
-            type: 'scatter',
-            mode: 'lines',
-            line: {{ color: OXYGEN_COLOR, width: 1.5 }},
-            xaxis: 'x3',
-            yaxis: 'y3'
-        }};
-
-        const multiTrace4 = {{
-            x: timestamps,
-            y: co2,
-            name: 'CO₂',
-            type: 'scatter',
-            mode: 'lines',
-            line: {{ color: CO2_COLOR, width: 1.5 }},
-            xaxis: 'x4',
-            yaxis: 'y4'
-        }};
-
-        const multiLayout = {{
-            font: {{ family: 'Inter, sans-serif' }},
-            plot_bgcolor: 'white',
-            paper_bgcolor: 'transparent',
-            height: 700,
-            showlegend: true,
-            legend: {{
-                orientation: 'h',
-                y: -0.08,
-                x: 0.5,
-                xanchor: 'center'
-            }},
-            // Temperature subplot
-            xaxis1: {{
-                domain: [0, 1],
-                anchor: 'y1',
-                showticklabels: false
-            }},
-            yaxis1: {{
-                domain: [0.78, 1],
-                anchor: 'x1',
-                title: {{ text: 'Temperature (°C)', font: {{ color: TEMP_COLOR, size: 12 }} }},
-                tickfont: {{ color: TEMP_COLOR }}
-            }},
-            // Pressure subplot
-            xaxis2: {{
-                domain: [0, 1],
-                anchor: 'y2',
-                showticklabels: false
-            }},
-            yaxis2: {{
-                domain: [0.52, 0.74],
-                anchor: 'x2',
-                title: {{ text: 'Pressure (mbar)', font: {{ color: PRESSURE_COLOR, size: 12 }} }},
-                tickfont: {{ color: PRESSURE_COLOR }}
-            }},
-            // Oxygen subplot
-            xaxis3: {{
-                domain: [0, 1],
-                anchor: 'y3',
-                showticklabels: false
-            }},
-            yaxis3: {{
-                domain: [0.26, 0.48],
-                anchor: 'x3',
-                title: {{ text: 'Oxygen (%)', font: {{ color: OXYGEN_COLOR, size: 12 }} }},
-                tickfont: {{ color: OXYGEN_COLOR }}
-            }},
-            // CO2 subplot
-            xaxis4: {{
-                domain: [0, 1],
-                anchor: 'y4',
-                title: 'Date'
-            }},
-            yaxis4: {{
-                domain: [0, 0.22],
-                anchor: 'x4',
-                title: {{ text: 'CO₂ (%)', font: {{ color: CO2_COLOR, size: 12 }} }},
-                tickfont: {{ color: CO2_COLOR }}
-            }},
-            margin: {{ l: 70, r: 40, t: 20, b: 60 }}
-        }};
-
-        Plotly.newPlot('multiparamChart', [multiTrace1, multiTrace2, multiTrace3, multiTrace4], multiLayout, {{responsive: true}});
-
-        // Individual Temperature Chart
-        const tempTrace = {{
-            x: timestamps,
-            y: temperature,
-            type: 'scatter',
-            mode: 'lines',
-            line: {{ color: TEMP_COLOR, width: 2 }},
-            fill: 'tozeroy',
-            fillcolor: TEMP_COLOR + '20',
-            name: 'Temperature'
-        }};
-
-        const tempMean = {stats['temperature_c']['mean']};
-        const tempMeanTrace = {{
-            x: [timestamps[0], timestamps[timestamps.length-1]],
-            y: [tempMean, tempMean],
-            type: 'scatter',
-            mode: 'lines',
-            line: {{ color: TEMP_COLOR, dash: 'dash', width: 2 }},
-            name: 'Mean'
-        }};
-
-        Plotly.newPlot('tempChart', [tempTrace, tempMeanTrace], {{
-            ...commonLayout,
-            height: 300,
-            xaxis: {{ title: 'Date' }},
-            yaxis: {{ title: 'Temperature (°C)' }}
-        }}, {{responsive: true}});
-
-        // Individual Pressure Chart
-        const pressureTrace = {{
-            x: timestamps,
-            y: pressure,
-            type: 'scatter',
-            mode: 'lines',
-            line: {{ color: PRESSURE_COLOR, width: 2 }},
-            fill: 'tozeroy',
-            fillcolor: PRESSURE_COLOR + '20',
-            name: 'Pressure'
-        }};
-
-        const pressureMean = {stats['pressure_mbar']['mean']};
-        const pressureMeanTrace = {{
-            x: [timestamps[0], timestamps[timestamps.length-1]],
-            y: [pressureMean, pressureMean],
-            type: 'scatter',
-            mode: 'lines',
-            line: {{ color: PRESSURE_COLOR, dash: 'dash', width: 2 }},
-            name: 'Mean'
-        }};
-
-        Plotly.newPlot('pressureChart', [pressureTrace, pressureMeanTrace], {{
-            ...commonLayout,
-            height: 300,
-            xaxis: {{ title: 'Date' }},
-            yaxis: {{ title: 'Pressure (mbar)' }}
-        }}, {{responsive: true}});
-
-        // Individual Oxygen Chart
-        const oxygenTrace = {{
-            x: timestamps,
-            y: oxygen,
-            type: 'scatter',
-            mode: 'lines',
-            line: {{ color: OXYGEN_COLOR, width: 2 }},
-            fill: 'tozeroy',
-            fillcolor: OXYGEN_COLOR + '20',
-            name: 'Oxygen'
-        }};
-
-        const oxygenMean = {stats['oxygen_pct']['mean']};
-        const oxygenMeanTrace = {{
-            x: [timestamps[0], timestamps[timestamps.length-1]],
-            y: [oxygenMean, oxygenMean],
-            type: 'scatter',
-            mode: 'lines',
-            line: {{ color: OXYGEN_COLOR, dash: 'dash', width: 2 }},
-            name: 'Mean'
-        }};
-
-        Plotly.newPlot('oxygenChart', [oxygenTrace, oxygenMeanTrace], {{
-            ...commonLayout,
-            height: 300,
-            xaxis: {{ title: 'Date' }},
-            yaxis: {{ title: 'Oxygen (%)' }}
-        }}, {{responsive: true}});
-
-        // Individual CO2 Chart
-        const co2Trace = {{
-            x: timestamps,
-            y: co2,
-            type: 'scatter',
-            mode: 'lines',
-            line: {{ color: CO2_COLOR, width: 2 }},
-            fill: 'tozeroy',
-            fillcolor: CO2_COLOR + '20',
-            name: 'CO₂'
-        }};
-
-        const co2Mean = {stats['co2_pct']['mean']};
-        const co2MeanTrace = {{
-            x: [timestamps[0], timestamps[timestamps.length-1]],
-            y: [co2Mean, co2Mean],
-            type: 'scatter',
-            mode: 'lines',
-            line: {{ color: CO2_COLOR, dash: 'dash', width: 2 }},
-            name: 'Mean'
-        }};
-
-        Plotly.newPlot('co2Chart', [co2Trace, co2MeanTrace], {{
-            ...commonLayout,
-            height: 300,
-            xaxis: {{ title: 'Date' }},
-            yaxis: {{ title: 'CO₂ (%)' }}
-        }}, {{responsive: true}});
-
-        // Correlation Heatmap
-        const corrData = [
-            [{analysis['correlation_analysis']['pearson']['temperature_c']['temperature_c']:.3f},
-             {analysis['correlation_analysis']['pearson']['temperature_c']['pressure_mbar']:.3f},
-             {analysis['correlation_analysis']['pearson']['temperature_c']['oxygen_pct']:.3f},
-             {analysis['correlation_analysis']['pearson']['temperature_c']['co2_pct']:.3f}],
-            [{analysis['correlation_analysis']['pearson']['pressure_mbar']['temperature_c']:.3f},
-             {analysis['correlation_analysis']['pearson']['pressure_mbar']['pressure_mbar']:.3f},
-             {analysis['correlation_analysis']['pearson']['pressure_mbar']['oxygen_pct']:.3f},
-             {analysis['correlation_analysis']['pearson']['pressure_mbar']['co2_pct']:.3f}],
-            [{analysis['correlation_analysis']['pearson']['oxygen_pct']['temperature_c']:.3f},
-             {analysis['correlation_analysis']['pearson']['oxygen_pct']['pressure_mbar']:.3f},
-             {analysis['correlation_analysis']['pearson']['oxygen_pct']['oxygen_pct']:.3f},
-             {analysis['correlation_analysis']['pearson']['oxygen_pct']['co2_pct']:.3f}],
-            [{analysis['correlation_analysis']['pearson']['co2_pct']['temperature_c']:.3f},
-             {analysis['correlation_analysis']['pearson']['co2_pct']['pressure_mbar']:.3f},
-             {analysis['correlation_analysis']['pearson']['co2_pct']['oxygen_pct']:.3f},
-             {analysis['correlation_analysis']['pearson']['co2_pct']['co2_pct']:.3f}]
-        ];
-
-        const corrTrace = {{
-            z: corrData,
-            x: ['Temperature', 'Pressure', 'Oxygen', 'CO₂'],
-            y: ['Temperature', 'Pressure', 'Oxygen', 'CO₂'],
-            type: 'heatmap',
-            colorscale: [
-                [0, '#d62728'], [0.5, 'white'], [1, OXYGEN_COLOR]
-            ],
-            zmin: -1,
-            zmax: 1,
-            text: corrData,
-            texttemplate: '%{{text:.2f}}',
-            textfont: {{ size: 14 }},
-            colorbar: {{
-                title: 'Correlation',
-                titleside: 'right'
-            }}
-        }};
-
-        Plotly.newPlot('corrChart', [corrTrace], {{
-            ...commonLayout,
-            height: 400,
-            xaxis: {{ side: 'bottom' }},
-            yaxis: {{ autorange: 'reversed' }}
-        }}, {{responsive: true}});
-
-        // Distribution Histograms
-        const tempDistTrace = {{
-            x: temperature,
-            type: 'histogram',
-            name: 'Temperature',
-            marker: {{ color: TEMP_COLOR, opacity: 0.7 }},
-            nbinsx: 30
-        }};
-
-        Plotly.newPlot('tempDist', [tempDistTrace], {{
-            ...commonLayout,
-            height: 250,
-            xaxis: {{ title: 'Temperature (°C)' }},
-            yaxis: {{ title: 'Frequency' }},
-            showlegend: false
-        }}, {{responsive: true}});
-
-        const pressureDistTrace = {{
-            x: pressure,
-            type: 'histogram',
-            name: 'Pressure',
-            marker: {{ color: PRESSURE_COLOR, opacity: 0.7 }},
-            nbinsx: 30
-        }};
-
-        Plotly.newPlot('pressureDist', [pressureDistTrace], {{
-            ...commonLayout,
-            height: 250,
-            xaxis: {{ title: 'Pressure (mbar)' }},
-            yaxis: {{ title: 'Frequency' }},
-            showlegend: false
-        }}, {{responsive: true}});
-
-        const oxygenDistTrace = {{
-            x: oxygen,
-            type: 'histogram',
-            name: 'Oxygen',
-            marker: {{ color: OXYGEN_COLOR, opacity: 0.7 }},
-            nbinsx: 30
-        }};
-
-        Plotly.newPlot('oxygenDist', [oxygenDistTrace], {{
-            ...commonLayout,
-            height: 250,
-            xaxis: {{ title: 'Oxygen (%)' }},
-            yaxis: {{ title: 'Frequency' }},
-            showlegend: false
-        }}, {{responsive: true}});
-
-        const co2DistTrace = {{
-            x: co2,
-            type: 'histogram',
-            name: 'CO₂',
-            marker: {{ color: CO2_COLOR, opacity: 0.7 }},
-            nbinsx: 30
-        }};
-
-        Plotly.newPlot('co2Dist', [co2DistTrace], {{
-            ...commonLayout,
-            height: 250,
-            xaxis: {{ title: 'CO₂ (%)' }},
-            yaxis: {{ title: 'Frequency' }},
-            showlegend: false
-        }}, {{responsive: true}});
-
-        // Collapsible sections
-        const collapsibles = document.querySelectorAll('.collapsible');
-        collapsibles.forEach(collapsible => {{
-            collapsible.addEventListener('click', function() {{
-                this.classList.toggle('active');
-                const content = this.nextElementSibling;
-                content.classList.toggle('active');
-            }});
-        }});
-
-        // Smooth scroll for navigation
-        document.querySelectorAll('a[href^="#"]').forEach(anchor => {{
-            anchor.addEventListener('click', function (e) {{
-                e.preventDefault();
-                const target = document.querySelector(this.getAttribute('href'));
-                if (target) {{
-                    target.scrollIntoView({{ behavior: 'smooth', block: 'start' }});
-                }}
-            }});
-        }});
-
-        // Back to top button
-        const backToTop = document.getElementById('backToTop');
-        window.addEventListener('scroll', () => {{
-            if (window.pageYOffset > 300) {{
-                backToTop.classList.add('visible');
-            }} else {{
-                backToTop.classList.remove('visible');
-            }}
-        }});
-
-        function scrollToTop() {{
-            window.scrollTo({{ top: 0, behavior: 'smooth' }});
-        }}
-
-        // Modal functions
-        function openModal(imageSrc) {{
-            const modal = document.getElementById('imageModal');
-            const modalImg = document.getElementById('modalImage');
-            modal.classList.add('active');
-            modalImg.src = imageSrc;
-        }}
-
-        function closeModal() {{
-            const modal = document.getElementById('imageModal');
-            modal.classList.remove('active');
-        }}
-
-        // ESC key to close modal
-        document.addEventListener('keydown', (e) => {{
-            if (e.key === 'Escape') {{
-                closeModal();
-            }}
-        }});
-    </script>
-</body>
-</html>
-"""
+""")
+
+def inlined_images(inline_images=False):
+    """Names of the gallery PNGs to embed as data URIs"""
+    if not inline_images:
+        return set()
+    return {name for name in CRITICAL_IMAGES if (viz_dir / name).exists()}
+
+def write_preloads(fh, inline_images=False):
+    """Write <link rel="preload"> hints for the hero PNGs left as URLs"""
+    inline = inlined_images(inline_images)
+    fh.writelines(PRELOAD_TMPL.substitute(url=f'./visualizations/{name}').encode()
+                  for name, _, _ in GALLERY_IMAGES if name in CRITICAL_IMAGES and name not in inline)
+
+def write_gallery_items(fh, inline_images=False):
+    """Write the gallery images, optionally embedding the hero PNG"""
+    paths = [viz_dir / name for name, _, _ in GALLERY_IMAGES]
+    names = inlined_images(inline_images)
+    inline = [path for path in paths if path.name in names]
+
+    # Read and encode the inlined images up front on a thread pool,
+    # overlapping the file I/O
+    encoded = {}
+    if inline:
+        with ThreadPoolExecutor(max_workers=min(8, len(inline))) as ex:
+            encoded = dict(zip(inline, ex.map(encode_image, inline)))
+
+    # Collect the pieces, base64 payloads included as they are, and hand
+    # them to one writelines call rather than joining them first
+    parts = []
+    for (name, alt, caption), path in zip(GALLERY_IMAGES, paths):
+        url = f'./visualizations/{name}'
+        parts.append(GALLERY_ITEM_OPEN.substitute(url=url).encode())
+        if path in encoded:
+            parts += [b'                    <img src="data:image/png;base64,', encoded[path],
+                      f'" alt="{alt}">\n'.encode()]
+        else:
+            lazy = '' if name in CRITICAL_IMAGES else ' loading="lazy"'
+            parts.append(f'                    <img src="{url}" alt="{alt}"{lazy}>\n'.encode())
+        parts.append(GALLERY_ITEM_CLOSE.substitute(caption=caption).encode())
+    fh.writelines(parts)
+
+def write_downsample_note(fh, shown, total):
+    """Note under the charts heading, only when samples were dropped"""
+    if shown < total:
+        fh.write(DOWNSAMPLE_NOTE_TMPL.substitute(shown=f'{shown:,}', total=f'{total:,}').encode())
+
+# Upper bound on embedded samples; beyond it each of the four series is
+# LTTB-downsampled to an equal share (1,000 points per trace)
+MAX_CHART_POINTS = 4000
+
+def downsample(df, n_out=MAX_CHART_POINTS):
+    """Rows of df kept by LTTB on any numeric column, in time order
+
+    Each column is reduced to n_out // columns points, so the union, which
+    keeps the columns aligned on one shared timestamp array, stays within
+    n_out rows. Note the histograms are drawn from the same reduced rows.
+    """
+    if len(df) <= n_out:
+        return df
+    x = df['timestamp'].to_numpy(dtype='datetime64[ns]').astype(np.int64).astype(float)
+    columns = df.select_dtypes(include=[np.number]).columns
+    keep = [lttb_indices(x, df[col].to_numpy(dtype=float), n_out // len(columns))
+            for col in columns]
+    return df.iloc[np.unique(np.concatenate(keep))]
+
+# Decimal places embedded for each charted reading; more than the charts
+# can show. Columns rounded to 0 places are emitted as integers.
+CHART_DECIMALS = {'temperature_c': 2, 'pressure_mbar': 0, 'oxygen_pct': 2, 'co2_pct': 2}
+
+# Short keys of the embedded chart arrays, as destructured by the page script;
+# write_chart_data() adds t0, the time the 't' offsets count from
+CHART_KEYS = {'timestamp': 't', 'temperature_c': 'temp', 'pressure_mbar': 'pres',
+              'oxygen_pct': 'o2', 'co2_pct': 'co2'}
+
+# File the chart data is written to with external_data, next to the page
+CHART_DATA_NAME = 'sensor_data.json'
+
+def quantize(chart_df):
+    """Copy of chart_df with readings rounded to CHART_DECIMALS"""
+    columns = {}
+    for col, decimals in CHART_DECIMALS.items():
+        values = chart_df[col].round(decimals)
+        if decimals == 0 and values.notna().all():
+            values = values.astype('int16')
+        columns[col] = values
+    return chart_df.assign(**columns)
+
+
+# Decimal places for each displayed statistic, per parameter in PARAMETERS
+# order (t, p, o, c); pressure is reported in whole millibars. card_mean is
+# the headline value on the metric cards, the rest appear in the tables.
+DISPLAY_DECIMALS = {
+    'card_mean': (1, 0, 1, 1),
+    'mean': (2, 1, 2, 2),
+    'median': (2, 1, 2, 2),
+    'std': (2, 1, 2, 2),
+    'min': (1, 0, 1, 1),
+    'max': (1, 0, 1, 1),
+    'range': (1, 0, 1, 1),
+    'cv_pct': (1, 1, 1, 1),
+    'skew': (3, 3, 3, 3),
+    'kurt': (3, 3, 3, 3),
+    'sw_p': (4, 4, 4, 4),
+    'iqr_pct': (1, 1, 1, 1),
+    'z_pct': (1, 1, 1, 1)
+}
+CORRELATION_DECIMALS = 3
+# Fields shown with a % sign, unless they are n/a
+PERCENT_FIELDS = ('iqr_pct', 'z_pct')
+
+def template_context(analysis):
+    """Flatten every value the templates substitute into one dict
+
+    Per-parameter keys are prefixed t_, p_, o_ or c_ (e.g. t_mean, o_sw_p)
+    and hold display strings already formatted to DISPLAY_DECIMALS, so the
+    templates need no format specs; <prefix>_mean_value keeps the unrounded
+    mean for the charts. Pearson coefficients are r_<row><col>, e.g. r_oc
+    for oxygen vs CO2, and corr_matrix holds them all as a JS array literal
+    in PARAMETERS order. The statistics table bodies are prerendered into
+    summary_rows, normality_rows and outlier_rows.
+    """
+    stats = analysis['summary_statistics']
+    date_range = analysis['basic_info']['date_range']
+    ctx = {
+        'primary': BGS_PRIMARY,
+        'secondary': BGS_SECONDARY,
+        'start_date': date_range['start'].split()[0],
+        'end_date': date_range['end'].split()[0],
+        'duration_days': date_range['duration_days']
+    }
+
+    rows = {'summary_rows': [], 'normality_rows': [], 'outlier_rows': []}
+    for k, (col, pref) in enumerate(PARAMETERS):
+        col_stats = stats[col]
+        # A constant column has only {"degenerate": true} in place of test
+        # results, and None for its shape statistics; those render as n/a
+        shapiro = analysis['normality_tests'][col].get('shapiro_wilk', {})
+        outliers = analysis['outlier_detection'][col]
+        iqr = outliers.get('iqr_method', {})
+        zscore = outliers.get('zscore_method', {})
+        values = {
+            'card_mean': col_stats['mean'],
+            'mean': col_stats['mean'],
+            'median': col_stats['50%'],
+            'std': col_stats['std'],
+            'min': col_stats['min'],
+            'max': col_stats['max'],
+            'range': col_stats['range'],
+            'cv_pct': col_stats['cv'] * 100 if col_stats['cv'] is not None else None,
+            'skew': col_stats['skewness'],
+            'kurt': col_stats['kurtosis'],
+            'sw_p': shapiro.get('p_value'),
+            'iqr_pct': iqr.get('percentage'),
+            'z_pct': zscore.get('percentage')
+        }
+        for field, value in values.items():
+            if value is None:
+                ctx[f'{pref}_{field}'] = 'n/a'
+            else:
+                ctx[f'{pref}_{field}'] = f'{value:.{DISPLAY_DECIMALS[field][k]}f}' + ('%' if field in PERCENT_FIELDS else '')
+        ctx.update({
+            f'{pref}_mean_value': col_stats['mean'],
+            f'{pref}_sw_label': {True: 'Normal', False: 'Non-normal'}.get(shapiro.get('is_normal'), 'n/a'),
+            f'{pref}_iqr_count': iqr.get('count', 'n/a'),
+            f'{pref}_z_count': zscore.get('count', 'n/a')
+        })
+
+        fields = {key[len(pref) + 1:]: value for key, value in ctx.items()
+                  if key.startswith(pref + '_')}
+        icon, color, label, name = PARAMETER_LABELS[pref]
+        rows['summary_rows'].append(SUMMARY_ROW_TMPL.substitute(fields, icon=icon, color=color, label=label))
+        rows['normality_rows'].append(NORMALITY_ROW_TMPL.substitute(fields, name=name))
+        rows['outlier_rows'].append(OUTLIER_ROW_TMPL.substitute(fields, name=name))
+
+    ctx.update({key: '\n'.join(parts) for key, parts in rows.items()})
+
+    # Pearson block for PARAMETERS, formatted in one np.char.mod call
+    corr = analysis['correlation_analysis']
+    order = [corr['columns'].index(col) for col, _ in PARAMETERS]
+    cells = np.char.mod(f'%.{CORRELATION_DECIMALS}f', np.asarray(corr['pearson'])[np.ix_(order, order)])
+    for (_, row), row_cells in zip(PARAMETERS, cells.tolist()):
+        for (_, col), cell in zip(PARAMETERS, row_cells):
+            ctx[f'r_{row}{col}'] = cell
+    ctx['corr_matrix'] = '[' + ', '.join('[' + ', '.join(row_cells) + ']' for row_cells in cells.tolist()) + ']'
+
+    return ctx
+
+@per_file_version(DATA_FILE, ANALYSIS_FILE)
+def _load():
+    """Sensor readings and analysis results, only the charted columns"""
+    # pandas is imported here, not at module level, so --help and
+    # up-to-date runs do not pay for it
+    import pandas as pd
+
+    # Load data: only the charted columns, typed and date-parsed in one pass
+    readings = [col for col, _ in PARAMETERS]
+    df = pd.read_csv(DATA_FILE, usecols=['timestamp', *readings], parse_dates=['timestamp'],
+                     dtype={col: 'float32' for col in readings}, engine='c')
+
+    # Load analysis results
+    with open(ANALYSIS_FILE, 'r') as f:
+        analysis = json.load(f)
+    return df, analysis
+
+class _Tee:
+    """Write-only handle forwarding every write to several files"""
+
+    def __init__(self, *handles):
+        self.handles = handles
+
+    def write(self, data):
+        for handle in self.handles:
+            handle.write(data)
+
+    def writelines(self, parts):
+        for part in parts:
+            self.write(part)
+
+def _json_values(series):
+    """Column values as a list for json.dumps
+
+    float32 readings are widened through their shortest decimal repr, so
+    5.6 is embedded as 5.6 rather than 5.599999904632568.
+    """
+    if series.dtype == np.float32:
+        return series.to_numpy().astype(str).astype(np.float64).tolist()
+    return series.tolist()
+
+def write_chart_data(fh, chart_df):
+    """Write chart data to fh as compact JSON, one array per CHART_KEYS column
+
+    Timestamps are sent as t0, the first one in ISO 8601, plus whole seconds
+    since t0 per sample, which is far shorter than one ISO string each.
+    orjson, when installed, serializes every column straight from its NumPy
+    buffer (float32 in shortest form) and its bytes go to fh
+    as they are; otherwise json.dumps is used on Python lists. The payload
+    holds only numbers and one ISO timestamp, so it cannot contain "</script".
+    """
+    timestamps = chart_df['timestamp'].to_numpy().astype('datetime64[s]')
+    t0 = str(timestamps[0])
+    offsets = (timestamps - timestamps[0]).astype(np.int32)
+    if orjson is not None:
+        payload = {'t0': t0}
+        payload.update({key: np.ascontiguousarray(offsets if col == 'timestamp' else chart_df[col].to_numpy())
+                        for col, key in CHART_KEYS.items()})
+        fh.write(orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY))
+        return
+    payload = {'t0': t0}
+    payload.update({key: offsets.tolist() if col == 'timestamp' else _json_values(chart_df[col])
+                    for col, key in CHART_KEYS.items()})
+    fh.write(json.dumps(payload, separators=(',', ':')).encode())
+
+# Placeholders in TEMPLATE_FILE whose content build() writes to the page
+# itself instead of substituting; a newline right after one belongs to it
+SLOTS = ('preloads', 'css', 'downsample_note', 'gallery_items', 'chart_data', 'script')
+SLOT_RE = re.compile(r'\$(%s)\b\n?' % '|'.join(SLOTS))
+
+@functools.lru_cache(maxsize=1)
+def load_template(mtime):
+    """TEMPLATE_FILE split at its slots, read once per file version
+
+    Returns (section, slot) pairs in document order: each section is a
+    string.Template filled with template_context() and is followed by the
+    named slot, or by None at the end of the page. Keying on the mtime
+    lets edits to the template be picked up without a restart.
+    """
+    parts = SLOT_RE.split(TEMPLATE_FILE.read_text(encoding='utf-8'))
+    return [(Template(text), slot) for text, slot in zip(parts[::2], parts[1::2] + [None])]
+
+@functools.lru_cache(maxsize=1)
+def load_css(mtime):
+    """Stylesheet bytes to inline, minified when csscompressor is installed
+
+    The minified copy is cached next to the source as styles.min.css and
+    regenerated only when styles.css is newer. Like load_template, the
+    result is kept in memory per source mtime for repeated builds.
+    """
+    if csscompressor is None:
+        return CSS_FILE.read_bytes()
+    min_file = CSS_FILE.with_suffix('.min.css')
+    if not min_file.exists() or min_file.stat().st_mtime_ns < CSS_FILE.stat().st_mtime_ns:
+        css = csscompressor.compress(CSS_FILE.read_text(encoding='utf-8'))
+        min_file.write_text(css + '\n', encoding='utf-8')
+    return min_file.read_bytes()
+
+def _open_output(stack, path, compress):
+    """Binary handle on path, teed into a gzip copy at <path>.gz if compress"""
+    fh = stack.enter_context(open(path, 'wb', buffering=1 << 20))
+    if compress:
+        # mtime=0 keeps the archive byte-identical across rebuilds
+        gz_path = path.with_name(path.name + '.gz')
+        gz = stack.enter_context(gzip.GzipFile(gz_path, 'wb', compresslevel=9, mtime=0))
+        fh = _Tee(fh, gz)
+    return fh
+
+@functools.lru_cache(maxsize=1)
+def load_script(mtime):
+    """Page script as a string.Template, minified when rjsmin is installed
+
+    rjsmin leaves the $name placeholders alone, as they are valid JS
+    identifiers. Cached per source mtime like load_css.
+    """
+    script = SCRIPT_FILE.read_text(encoding='utf-8')
+    if rjsmin is not None:
+        script = rjsmin.jsmin(script) + '\n'
+    return Template(script)
+
+def build(out_path, inline_images=False, compress=False, external_data=False, force=False):
+    """Render the dashboard to out_path one section at a time
+
+    Each section of TEMPLATE_FILE, and each slot between them, is encoded
+    and written as soon as it is formatted, so the full document never
+    exists as a single string in memory. Gallery images are linked by
+    relative URL and preloaded from the head; inline_images embeds the hero
+    chart instead. With compress, the same writes also feed a gzip (level 9)
+    copy at <out>.gz for servers that serve precompressed files.
+
+    With external_data, the chart data goes to CHART_DATA_NAME next to the
+    page (gzipped too if compress) and the page fetches it after first
+    paint; this needs an HTTP server, as fetch() fails on file:// URLs.
+
+    When neither the inputs nor the page have changed since the last
+    build (see _data.is_current), the build is skipped.
+    Returns the size of the written page in bytes, or None if it was
+    already current.
+    """
+    out_path = Path(out_path)
+    inputs = [DATA_FILE, ANALYSIS_FILE, CSS_FILE, SCRIPT_FILE, TEMPLATE_FILE, Path(__file__),
+              Path(__file__).with_name('_data.py'), Path(__file__).with_name('_chart_kernels.py')]
+    if inline_images:
+        inputs += [viz_dir / name for name, _, _ in GALLERY_IMAGES]
+    data_path = out_path.with_name(CHART_DATA_NAME)
+    outputs = [out_path, data_path] if external_data else [out_path]
+    if compress:
+        outputs += [path.with_name(path.name + '.gz') for path in outputs]
+    key = build_key(inputs, (inline_images, compress, external_data,
+                             csscompressor is not None, rjsmin is not None))
+    if not force and is_current(out_path, key, outputs):
+        return None
 
-# Save the HTML file to parent directory (for GitHub Pages)
-output_file = Path(__file__).parent.parent / 'index.html'
-with open(output_file, 'w', encoding='utf-8') as f:
-    f.write(html_content)
-
-print(f"[OK] Dashboard created successfully!")
-print(f"  Location: {output_file}")
-print(f"  Size: {output_file.stat().st_size / 1024:.1f} KB")
-print(f"\nTo view: Open {output_file.name} in your web browser")
-print(f"\nGitHub Pages ready:")
-print(f"  [+] File saved as index.html in project root")
-print(f"  [+] All image paths use relative paths (./visualizations/)")
-print(f"  [+] No external file dependencies (except CDN)")
-print(f"\nFeatures included:")
-print(f"  [+] Interactive Plotly.js charts (zoom, pan, hover)")
-print(f"  [+] BGS brand colors throughout")
-print(f"  [+] Comprehensive statistics tables")
-print(f"  [+] Visualization gallery with lightbox")
-print(f"  [+] Responsive mobile-friendly design")
-print(f"  [+] Smooth scroll navigation")
-print(f"  [+] Collapsible sections for detailed info")
-print(f"  [+] Professional scientific styling")
+    df, analysis = _load()
+    ctx = template_context(analysis)
+    ctx['data_src'] = f' data-src="./{CHART_DATA_NAME}"' if external_data else ''
+    css = load_css(os.stat(CSS_FILE).st_mtime_ns)
+    script = load_script(os.stat(SCRIPT_FILE).st_mtime_ns)
+
+    # Prepare data for JavaScript embedding, one array per column rather
+    # than one object per row so key names are not repeated for every sample
+    chart_df = quantize(downsample(df))
+    if external_data:
+        with ExitStack() as stack:
+            write_chart_data(_open_output(stack, data_path, compress), chart_df)
+
+    with ExitStack() as stack:
+        fh = _open_output(stack, out_path, compress)
+
+        slot_writers = {
+            'preloads': lambda: write_preloads(fh, inline_images),
+            'css': lambda: fh.write(css),
+            'downsample_note': lambda: write_downsample_note(fh, len(chart_df), len(df)),
+            'gallery_items': lambda: write_gallery_items(fh, inline_images),
+            'chart_data': (lambda: None) if external_data else (lambda: write_chart_data(fh, chart_df)),
+            'script': lambda: fh.write(script.substitute(ctx).encode())
+        }
+        for section, slot in load_template(os.stat(TEMPLATE_FILE).st_mtime_ns):
+            fh.write(section.substitute(ctx).encode())
+            if slot is not None:
+                slot_writers[slot]()
+
+    record_build(out_path, key)
+    return out_path.stat().st_size
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--inline-images', action='store_true',
+                        help='embed the hero gallery chart as a data URI')
+    parser.add_argument('--gzip', action='store_true',
+                        help='also write a precompressed index.html.gz')
+    parser.add_argument('--external-data', action='store_true',
+                        help=f'write chart data to {CHART_DATA_NAME} and fetch it (needs an HTTP server)')
+    parser.add_argument('--force', action='store_true',
+                        help='rebuild even if the inputs are unchanged')
+    args = parser.parse_args()
+
+    # Save the HTML file to parent directory (for GitHub Pages)
+    output_file = Path(__file__).parent.parent / 'index.html'
+    size = build(output_file, inline_images=args.inline_images, compress=args.gzip,
+                 external_data=args.external_data, force=args.force)
+    if size is None:
+        print(f"[OK] Dashboard is up to date: {output_file}")
+        print(f"  Inputs unchanged since the last build (use --force to rebuild)")
+        raise SystemExit(0)
+
+    print(f"[OK] Dashboard created successfully!")
+    print(f"  Location: {output_file}")
+    print(f"  Size: {size / 1024:.1f} KB")
+    if args.external_data:
+        print(f"  Chart data: {output_file.with_name(CHART_DATA_NAME)} (serve over HTTP)")
+    print(f"\nTo view: Open {output_file.name} in your web browser")
+    print(f"\nGitHub Pages ready:")
+    print(f"  [+] File saved as index.html in project root")
+    print(f"  [+] All image paths use relative paths (./visualizations/)")
+    if args.external_data:
+        print(f"  [+] Chart data loaded from ./{CHART_DATA_NAME}, which must be deployed alongside")
+    else:
+        print(f"  [+] No external file dependencies (except CDN)")
+    print(f"\nFeatures included:")
+    print(f"  [+] Interactive Plotly.js charts (zoom, pan, hover)")
+    print(f"  [+] BGS brand colors throughout")
+    print(f"  [+] Comprehensive statistics tables")
+    print(f"  [+] Visualization gallery with lightbox")
+    print(f"  [+] Responsive mobile-friendly design")
+    print(f"  [+] Smooth scroll navigation")
+    print(f"  [+] Collapsible sections for detailed info")
+    print(f"  [+] Professional scientific styling")
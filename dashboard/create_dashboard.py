@@ -4,30 +4,45 @@ Create Interactive HTML Dashboard for BGS Sensor Data Analysis
 Professional dashboard with BGS branding and Plotly visualizations
 """
 
-import pandas as pd
 import plotly.graph_objects as go
-import plotly.express as px
+import plotly.io as pio
+from plotly.io.json import to_json_plotly
 from plotly.subplots import make_subplots
-import json
+from plotly.offline import get_plotlyjs_version
 from pathlib import Path
 import numpy as np
+import argparse
+import gzip
+import shutil
+from _chart_kernels import lttb
+from _data import DATA_FILE, ANALYSIS_FILE, load_data, build_key, is_current, record_build
 
 # BGS Brand Colors
 BGS_PRIMARY = '#002E40'
 BGS_SECONDARY = '#AD9C70'
 BGS_ACCENT = '#4A90E2'
 
-def load_data():
-    """Load sensor data and analysis results"""
-    data_file = Path(__file__).parent.parent / 'data' / 'raw_sensor_data.csv'
-    df = pd.read_csv(data_file)
-    df['timestamp'] = pd.to_datetime(df['timestamp'])
+# plotly.js matching the installed plotly.py: its JSON sends NumPy arrays
+# as typed-array specs ({"dtype": ..., "bdata": ...}), which older
+# plotly.js releases cannot decode
+PLOTLY_JS_URL = f'https://cdn.plot.ly/plotly-{get_plotlyjs_version()}.min.js'
 
-    analysis_file = Path(__file__).parent.parent / 'analysis' / 'eda_analysis.json'
-    with open(analysis_file, 'r') as f:
-        analysis = json.load(f)
+# Line and box colours, one per parameter in NUMERIC_COLS order
+SERIES_COLORS = [BGS_ACCENT, '#ff7f0e', '#2ca02c', '#d62728']
 
-    return df, analysis
+# House style on top of plotly's default template, registered once for
+# every figure: title font and the parameter colours as the colorway
+pio.templates['bgs'] = go.layout.Template(layout=dict(
+    title_font=dict(size=18, color=BGS_PRIMARY),
+    colorway=SERIES_COLORS
+))
+pio.templates.default = 'plotly+bgs'
+
+# Sensor readings, in the order the correlation matrix uses
+NUMERIC_COLS = ['temperature_c', 'pressure_mbar', 'oxygen_pct', 'co2_pct']
+
+# Points kept per time-series trace; longer series are thinned by LTTB
+MAX_TRACE_POINTS = 2000
 
 def create_time_series_plot(df):
     """Create interactive multi-parameter time series"""
@@ -39,27 +54,35 @@ def create_time_series_plot(df):
         vertical_spacing=0.05
     )
 
+    # Trace constructors in this file skip plotly's per-property validation
+    # (_validate=False): their arguments are fixed in this file, and the
+    # checks cost more than building the trace itself
+
     # Temperature
-    fig.add_trace(go.Scatter(x=df['timestamp'], y=df['temperature_c'],
-                             name='Temperature', line=dict(color=BGS_ACCENT, width=2),
+    x, y = lttb(df, 'temperature_c', MAX_TRACE_POINTS)
+    fig.add_trace(go.Scattergl(_validate=False, x=x, y=y,
+                             name='Temperature', line=dict(width=2),
                              hovertemplate='%{y:.1f}°C<extra></extra>'),
                   row=1, col=1)
 
     # Pressure
-    fig.add_trace(go.Scatter(x=df['timestamp'], y=df['pressure_mbar'],
-                             name='Pressure', line=dict(color='#ff7f0e', width=2),
+    x, y = lttb(df, 'pressure_mbar', MAX_TRACE_POINTS)
+    fig.add_trace(go.Scattergl(_validate=False, x=x, y=y,
+                             name='Pressure', line=dict(width=2),
                              hovertemplate='%{y:.0f} mbar<extra></extra>'),
                   row=2, col=1)
 
     # Oxygen
-    fig.add_trace(go.Scatter(x=df['timestamp'], y=df['oxygen_pct'],
-                             name='Oxygen', line=dict(color='#2ca02c', width=2),
+    x, y = lttb(df, 'oxygen_pct', MAX_TRACE_POINTS)
+    fig.add_trace(go.Scattergl(_validate=False, x=x, y=y,
+                             name='Oxygen', line=dict(width=2),
                              hovertemplate='%{y:.1f}%<extra></extra>'),
                   row=3, col=1)
 
     # CO2
-    fig.add_trace(go.Scatter(x=df['timestamp'], y=df['co2_pct'],
-                             name='CO₂', line=dict(color='#d62728', width=2),
+    x, y = lttb(df, 'co2_pct', MAX_TRACE_POINTS)
+    fig.add_trace(go.Scattergl(_validate=False, x=x, y=y,
+                             name='CO₂', line=dict(width=2),
                              hovertemplate='%{y:.1f}%<extra></extra>'),
                   row=4, col=1)
 
@@ -68,28 +91,26 @@ def create_time_series_plot(df):
         height=900,
         showlegend=False,
         title_text='<b>Time Series Analysis - BGS Site 1 GasClam Borehole</b>',
-        title_font=dict(size=20, color=BGS_PRIMARY),
-        hovermode='x unified'
+        title_font_size=20,
+        hovermode='x'
     )
 
     return fig
 
-def create_correlation_heatmap(df):
-    """Create interactive correlation heatmap"""
-    numeric_cols = ['temperature_c', 'pressure_mbar', 'oxygen_pct', 'co2_pct']
-    corr_matrix = df[numeric_cols].corr()
-
+def create_correlation_heatmap(corr):
+    """Create interactive correlation heatmap from the NUMERIC_COLS correlation matrix"""
     labels = ['Temperature', 'Pressure', 'Oxygen', 'CO₂']
 
     fig = go.Figure(data=go.Heatmap(
-        z=corr_matrix.values,
+        _validate=False,
+        z=corr,
         x=labels,
         y=labels,
         colorscale='RdBu',
         zmid=0,
         zmin=-1,
         zmax=1,
-        text=np.round(corr_matrix.values, 3),
+        text=np.round(corr, 3),
         texttemplate='%{text}',
         textfont={"size": 12},
         colorbar=dict(title='Correlation')
@@ -97,7 +118,6 @@ def create_correlation_heatmap(df):
 
     fig.update_layout(
         title='<b>Parameter Correlation Matrix</b>',
-        title_font=dict(size=18, color=BGS_PRIMARY),
         xaxis_title='',
         yaxis_title='',
         height=500
@@ -105,6 +125,9 @@ def create_correlation_heatmap(df):
 
     return fig
 
+# Equal-width bins per distribution histogram
+HIST_BINS = 30
+
 def create_distribution_plots(df):
     """Create interactive distribution plots"""
     fig = make_subplots(
@@ -120,27 +143,30 @@ def create_distribution_plots(df):
         ('co2_pct', '%', 2, 2)
     ]
 
+    # Densities are binned here, so the page carries HIST_BINS bars per
+    # parameter rather than every sample for the browser to bin
     for col, unit, row, col_idx in parameters:
-        fig.add_trace(go.Histogram(x=df[col], name=col,
-                                   histnorm='probability density',
-                                   marker=dict(color=BGS_ACCENT, opacity=0.7),
-                                   hovertemplate=f'Value: %{{x:.2f}} {unit}<br>Density: %{{y:.3f}}<extra></extra>'),
+        density, edges = np.histogram(df[col].to_numpy(dtype=float), bins=HIST_BINS, density=True)
+        fig.add_trace(go.Bar(_validate=False, x=(edges[:-1] + edges[1:]) / 2, y=density,
+                             width=np.diff(edges), name=col,
+                             marker=dict(color=BGS_ACCENT, opacity=0.7),
+                             hovertemplate=f'Value: %{{x:.2f}} {unit}<br>Density: %{{y:.3f}}<extra></extra>'),
                       row=row, col=col_idx)
 
     fig.update_layout(
         height=600,
         showlegend=False,
-        title_text='<b>Parameter Distributions</b>',
-        title_font=dict(size=18, color=BGS_PRIMARY)
+        title_text='<b>Parameter Distributions</b>'
     )
 
     return fig
 
-def create_scatter_plot(df):
-    """Create O2 vs CO2 scatter plot"""
+def create_scatter_plot(df, slope, intercept, r):
+    """Create O2 vs CO2 scatter plot with its least-squares trendline"""
     fig = go.Figure()
 
-    fig.add_trace(go.Scatter(
+    fig.add_trace(go.Scattergl(
+        _validate=False,
         x=df['oxygen_pct'],
         y=df['co2_pct'],
         mode='markers',
@@ -152,27 +178,24 @@ def create_scatter_plot(df):
             colorbar=dict(title='Temp (°C)'),
             line=dict(width=0.5, color='white')
         ),
-        text=[f'Temp: {t:.1f}°C<br>O₂: {o:.1f}%<br>CO₂: {c:.1f}%'
-              for t, o, c in zip(df['temperature_c'], df['oxygen_pct'], df['co2_pct'])],
-        hovertemplate='%{text}<extra></extra>'
+        # Hover text formatted in the browser from the arrays already sent
+        hovertemplate='Temp: %{marker.color:.1f}°C<br>O₂: %{x:.1f}%<br>CO₂: %{y:.1f}%<extra></extra>'
     ))
 
     # Add trendline
-    z = np.polyfit(df['oxygen_pct'], df['co2_pct'], 1)
-    p = np.poly1d(z)
     x_line = np.linspace(df['oxygen_pct'].min(), df['oxygen_pct'].max(), 100)
 
     fig.add_trace(go.Scatter(
+        _validate=False,
         x=x_line,
-        y=p(x_line),
+        y=slope * x_line + intercept,
         mode='lines',
         line=dict(color='red', dash='dash', width=2),
-        name=f'Trendline (R²={np.corrcoef(df["oxygen_pct"], df["co2_pct"])[0,1]**2:.3f})'
+        name=f'Trendline (R²={r**2:.3f})'
     ))
 
     fig.update_layout(
         title='<b>Oxygen vs Carbon Dioxide Relationship</b>',
-        title_font=dict(size=18, color=BGS_PRIMARY),
         xaxis_title='Oxygen (%)',
         yaxis_title='Carbon Dioxide (%)',
         height=500,
@@ -195,45 +218,88 @@ def create_box_plots(df):
         ('co2_pct', 4)
     ]
 
-    colors = [BGS_ACCENT, '#ff7f0e', '#2ca02c', '#d62728']
-
-    for idx, (col, col_idx) in enumerate(parameters):
-        fig.add_trace(go.Box(y=df[col], name=col,
-                             marker=dict(color=colors[idx]),
+    for col, col_idx in parameters:
+        fig.add_trace(go.Box(_validate=False, y=df[col], name=col,
                              boxmean='sd'),
                       row=1, col=col_idx)
 
     fig.update_layout(
         height=400,
         showlegend=False,
-        title_text='<b>Parameter Box Plots - Outlier Detection</b>',
-        title_font=dict(size=18, color=BGS_PRIMARY)
+        title_text='<b>Parameter Box Plots - Outlier Detection</b>'
     )
 
     return fig
 
-def generate_html(df, analysis):
-    """Generate complete HTML dashboard"""
-
-    # Create all plots
-    ts_plot = create_time_series_plot(df)
-    corr_plot = create_correlation_heatmap(df)
-    dist_plot = create_distribution_plots(df)
-    scatter_plot = create_scatter_plot(df)
-    box_plot = create_box_plots(df)
+def fit_line(x, y):
+    """Slope and intercept of the least-squares line through (x, y)
+
+    Closed form on centred values, so unlike np.polyfit no Vandermonde
+    matrix or lstsq call is needed, and readings far from zero (oxygen
+    sits near 21%) lose no precision to cancellation.
+    """
+    mean_x, mean_y = x.mean(), y.mean()
+    dx = x - mean_x
+    slope = dx @ (y - mean_y) / (dx @ dx)
+    return slope, mean_y - slope * mean_x
+
+# Plotly.js config for every figure; responsive is what fig.to_html() sets
+PLOT_CONFIG = {'responsive': True}
+
+def plot_call(div_id, fig):
+    """JS statement drawing fig into the element with id div_id once it nears the viewport
+
+    The figure is embedded as JSON with PLOT_CONFIG alongside it, without
+    a second validation pass (the go objects already checked every
+    property); plotly.io picks orjson as its encoder when installed, which
+    is much faster than the stdlib json module on the numeric arrays. The
+    layout template is left out: the page sends it once as plotTemplate.
+    """
+    spec = fig.to_plotly_json()
+    layout = {key: value for key, value in spec['layout'].items() if key != 'template'}
+    spec = {'data': spec['data'], 'layout': layout, 'config': PLOT_CONFIG}
+    return f"plot('{div_id}', {pio.to_json(spec, validate=False)});"
+
+def fmt(value, spec, suffix=''):
+    """value formatted with spec plus suffix, or "n/a" for a statistic the
+    analysis leaves undefined (None), such as the skewness of a constant column"""
+    return 'n/a' if value is None else format(value, spec) + suffix
+
+def write_html(fh, df, analysis):
+    """Write the complete HTML dashboard to the binary handle fh
+
+    The page is streamed: the static part first, then each figure is
+    built, serialized and written in turn, so only one figure's JSON is
+    held in memory at a time.
+    """
+
+    # Correlations and the O2 vs CO2 fit, computed once for the figures
+    corr = df[NUMERIC_COLS].corr().to_numpy()
+    o2, co2 = NUMERIC_COLS.index('oxygen_pct'), NUMERIC_COLS.index('co2_pct')
+    slope, intercept = fit_line(df['oxygen_pct'].to_numpy(dtype=float), df['co2_pct'].to_numpy(dtype=float))
+
+    # Plots in page order: script comment, container id, figure builder
+    plots = [
+        ('Time Series Plot', 'timeseries', lambda: create_time_series_plot(df)),
+        ('Correlation Heatmap', 'correlation', lambda: create_correlation_heatmap(corr)),
+        ('Distribution Plots', 'distributions', lambda: create_distribution_plots(df)),
+        ('Scatter Plot', 'scatter', lambda: create_scatter_plot(df, slope, intercept, corr[o2, co2])),
+        ('Box Plots', 'boxplots', lambda: create_box_plots(df))
+    ]
 
-    # Get statistics
+    # Get statistics; a constant column has no outlier test results
     stats = analysis['summary_statistics']
+    co2_iqr = analysis['outlier_detection']['co2_pct'].get('iqr_method', {})
 
     # Generate HTML
-    html = f"""
+    page = f"""
 <!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>BGS Sensor Data Analysis Dashboard</title>
-    <script src="https://cdn.plot.ly/plotly-2.27.0.min.js"></script>
+    <script src="{PLOTLY_JS_URL}"></script>
     <style>
         * {{
             margin: 0;
@@ -279,6 +345,9 @@ def generate_html(df, analysis):
             padding: 25px;
             margin-bottom: 25px;
             box-shadow: 0 2px 8px rgba(0,0,0,0.1);
+            /* Off-screen sections skip layout and paint until scrolled near */
+            content-visibility: auto;
+            contain-intrinsic-size: auto 700px;
         }}
 
         .section h2 {{
@@ -462,7 +531,7 @@ def generate_html(df, analysis):
                         <td>{stats['temperature_c']['min']:.1f}</td>
                         <td>{stats['temperature_c']['50%']:.1f}</td>
                         <td>{stats['temperature_c']['max']:.1f}</td>
-                        <td>{stats['temperature_c']['skewness']:.3f}</td>
+                        <td>{fmt(stats['temperature_c']['skewness'], '.3f')}</td>
                     </tr>
                     <tr>
                         <td><strong>Pressure (mbar)</strong></td>
@@ -471,7 +540,7 @@ def generate_html(df, analysis):
                         <td>{stats['pressure_mbar']['min']:.0f}</td>
                         <td>{stats['pressure_mbar']['50%']:.0f}</td>
                         <td>{stats['pressure_mbar']['max']:.0f}</td>
-                        <td>{stats['pressure_mbar']['skewness']:.3f}</td>
+                        <td>{fmt(stats['pressure_mbar']['skewness'], '.3f')}</td>
                     </tr>
                     <tr>
                         <td><strong>Oxygen (%)</strong></td>
@@ -480,7 +549,7 @@ def generate_html(df, analysis):
                         <td>{stats['oxygen_pct']['min']:.1f}</td>
                         <td>{stats['oxygen_pct']['50%']:.1f}</td>
                         <td>{stats['oxygen_pct']['max']:.1f}</td>
-                        <td>{stats['oxygen_pct']['skewness']:.3f}</td>
+                        <td>{fmt(stats['oxygen_pct']['skewness'], '.3f')}</td>
                     </tr>
                     <tr>
                         <td><strong>CO₂ (%)</strong></td>
@@ -489,7 +558,7 @@ def generate_html(df, analysis):
                         <td>{stats['co2_pct']['min']:.1f}</td>
                         <td>{stats['co2_pct']['50%']:.1f}</td>
                         <td>{stats['co2_pct']['max']:.1f}</td>
-                        <td>{stats['co2_pct']['skewness']:.3f}</td>
+                        <td>{fmt(stats['co2_pct']['skewness'], '.3f')}</td>
                     </tr>
                 </tbody>
             </table>
@@ -529,7 +598,7 @@ def generate_html(df, analysis):
             <div class="plot-container" id="boxplots"></div>
             <p style="margin-top: 15px; font-size: 0.95em;">
                 <strong>Outlier Summary:</strong> Minimal outliers detected across all parameters.
-                CO₂ shows {analysis['outlier_detection']['co2_pct']['iqr_method']['percentage']:.1f}% outliers (IQR method),
+                CO₂ shows {fmt(co2_iqr.get('percentage'), '.1f', '%')} outliers (IQR method),
                 likely representing natural variations in subsurface gas concentrations.
             </p>
         </div>
@@ -597,45 +666,91 @@ def generate_html(df, analysis):
     </div>
 
     <script>
-        // Time Series Plot
-        {ts_plot.to_html(include_plotlyjs=False, div_id='timeseries').split('<div id="timeseries">')[1].split('</div>')[0]}
-
-        // Correlation Heatmap
-        {corr_plot.to_html(include_plotlyjs=False, div_id='correlation').split('<div id="correlation">')[1].split('</div>')[0]}
+        // Charts are drawn when their container first comes within 200px of
+        // the viewport, so first paint only lays out the charts on screen
+        const pendingPlots = new Map();
+        const plotObserver = 'IntersectionObserver' in window
+            ? new IntersectionObserver(entries => entries.forEach(entry => {{
+                if (!entry.isIntersecting) return;
+                plotObserver.unobserve(entry.target);
+                pendingPlots.get(entry.target.id)();
+                pendingPlots.delete(entry.target.id);
+            }}), {{ rootMargin: '200px' }})
+            : null;
+
+        // Layout template shared by every figure, so its JSON is sent once
+        const plotTemplate = {to_json_plotly(pio.templates[pio.templates.default].to_plotly_json())};
+
+        function plot(id, figure) {{
+            figure.layout.template = plotTemplate;
+            const draw = () => Plotly.newPlot(id, figure);
+            if (!plotObserver) {{
+                draw();
+                return;
+            }}
+            pendingPlots.set(id, draw);
+            plotObserver.observe(document.getElementById(id));
+        }}
 
-        // Distribution Plots
-        {dist_plot.to_html(include_plotlyjs=False, div_id='distributions').split('<div id="distributions">')[1].split('</div>')[0]}
+"""
+    fh.write(page.encode())
 
-        // Scatter Plot
-        {scatter_plot.to_html(include_plotlyjs=False, div_id='scatter').split('<div id="scatter">')[1].split('</div>')[0]}
+    for i, (title, div_id, make_figure) in enumerate(plots):
+        if i:
+            fh.write(b'\n')
+        fh.write(f"        // {title}\n        {plot_call(div_id, make_figure())}\n".encode())
 
-        // Box Plots
-        {box_plot.to_html(include_plotlyjs=False, div_id='boxplots').split('<div id="boxplots">')[1].split('</div>')[0]}
-    </script>
+    fh.write(b"""    </script>
 </body>
 </html>
-"""
-    return html
+""")
+
+def _cache_key(options):
+    """Fingerprint of the build inputs, the scripts included, and options"""
+    here = Path(__file__)
+    inputs = (DATA_FILE, ANALYSIS_FILE, here, here.with_name('_data.py'), here.with_name('_chart_kernels.py'))
+    return build_key(inputs, options)
+
+def main(compress=False, force=False):
+    # When neither the inputs nor the page have changed since the last
+    # build, loading and plotting are skipped
+    output_file = Path(__file__).parent / 'index.html'
+    gz_file = output_file.with_name(output_file.name + '.gz')
+    outputs = [output_file, gz_file] if compress else [output_file]
+    key = _cache_key((compress,))
+    if not force and is_current(output_file, key, outputs):
+        print(f"Dashboard is up to date: {output_file}")
+        print(f"  Inputs and page unchanged since the last build (use --force to rebuild)")
+        return
 
-def main():
     print("Creating BGS Sensor Data Dashboard...")
 
     # Load data
     df, analysis = load_data()
     print(f"Loaded {len(df)} observations from {df['timestamp'].min()} to {df['timestamp'].max()}")
 
-    # Generate HTML
+    # Generate and save the dashboard
     print("Generating dashboard HTML...")
-    html = generate_html(df, analysis)
-
-    # Save dashboard
-    output_file = Path(__file__).parent / 'index.html'
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(html)
+    with open(output_file, 'wb') as fh:
+        write_html(fh, df, analysis)
+    if compress:
+        # Level 9 for servers that send precompressed files as they are;
+        # mtime=0 keeps the archive byte-identical across rebuilds
+        with open(output_file, 'rb') as src, gzip.GzipFile(gz_file, 'wb', compresslevel=9, mtime=0) as gz:
+            shutil.copyfileobj(src, gz)
+    record_build(output_file, key)
 
     print(f"\n=== Dashboard Created Successfully ===")
     print(f"Dashboard saved to: {output_file}")
+    if compress:
+        print(f"Precompressed copy: {gz_file} ({gz_file.stat().st_size / 1024:.1f} KB)")
     print(f"\nTo view: Open {output_file} in your web browser")
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--gzip', action='store_true',
+                        help='also write a precompressed index.html.gz')
+    parser.add_argument('--force', action='store_true',
+                        help='rebuild even if the inputs are unchanged')
+    args = parser.parse_args()
+    main(compress=args.gzip, force=args.force)
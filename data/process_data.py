@@ -46,28 +46,31 @@ def process_sensor_data():
     # Note: In actual implementation, we'll load the full JSON data
     # For now, creating empty dataframes as placeholders
 
-    # Create individual dataframes for each parameter
-    dfs = []
+    # Stack every parameter's observations into one long frame, tagged
+    # with the parameter name
+    frames = []
+    names = []
 
     for data in [temperature_data, barometric_pressure_data, oxygen_data, co2_data]:
         if data['observations']:
             df = pd.DataFrame(data['observations'])
-            df['timestamp'] = pd.to_datetime(df['timestamp'])
-            df = df.rename(columns={'value': data['datastream_name'].split()[-1]})
-            df = df[['timestamp', data['datastream_name'].split()[-1], 'quality_status']]
-            dfs.append(df)
+            df['parameter'] = data['datastream_name'].split()[-1]
+            frames.append(df[['timestamp', 'parameter', 'value', 'quality_status']])
+            names.append(data['datastream_name'].split()[-1])
 
-    # Merge all dataframes on timestamp
-    if dfs:
-        combined = dfs[0]
-        for df in dfs[1:]:
-            combined = combined.merge(df, on='timestamp', how='outer', suffixes=('', '_dup'))
+    # One pivot to a column per parameter, rows sorted by timestamp; the
+    # quality flag comes from the first stream with a reading at that time.
+    # A stream reporting the same time twice keeps its first reading, as
+    # pivot() rejects duplicate index/column pairs
+    if frames:
+        long = pd.concat(frames, ignore_index=True)
+        long['timestamp'] = pd.to_datetime(long['timestamp'])
+        long = long.drop_duplicates(['timestamp', 'parameter'])
+        combined = long.pivot(index='timestamp', columns='parameter', values='value')[names]
+        combined['quality_status'] = long.groupby('timestamp')['quality_status'].first()
+        combined.columns.name = None
 
-        # Sort by timestamp
-        combined = combined.sort_values('timestamp')
-        combined = combined.reset_index(drop=True)
-
-        return combined
+        return combined.reset_index()
 
     return None
 